@@ -0,0 +1,60 @@
+"""Compare the automaton scan with the collect-and-sort approach on long lines."""
+
+import itertools
+import random
+import string
+import timeit
+
+from leet_parse_part_2 import (
+    get_first_and_last,
+    get_first_and_last_sorted,
+    number_words,
+)
+
+
+def make_line(length: int, seed: int = 0) -> str:
+    """Make a line of random letters, with some number words and digits mixed in."""
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    while size < length:
+        if rng.random() < 0.1:
+            part = rng.choice(number_words + list("123456789"))
+        else:
+            part = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+        parts.append(part)
+        size += len(part)
+
+    return "".join(parts)[:length]
+
+
+def make_line_sparse(length: int) -> str:
+    """Make a line with a single number in the middle, the worst case for a scan."""
+    half = (length - 3) // 2
+    return "x" * half + "six" + "x" * (length - 3 - half)
+
+
+def main():
+    print(f"{'Line':>7} {'Length':>10} {'Sorted [ms]':>12} {'Automaton [ms]':>15}")
+
+    for kind, length in itertools.product(
+        ("dense", "sparse"), (100, 1_000, 10_000, 100_000, 1_000_000)
+    ):
+        line = make_line(length) if kind == "dense" else make_line_sparse(length)
+        if get_first_and_last(line) != get_first_and_last_sorted(line):
+            raise RuntimeError(f"Results differ for line of length {length}")
+
+        number = max(1, 100_000 // length)
+        time_sorted = timeit.timeit(
+            lambda: get_first_and_last_sorted(line), number=number
+        )
+        time_automaton = timeit.timeit(lambda: get_first_and_last(line), number=number)
+
+        print(
+            f"{kind:>7} {length:>10} {time_sorted / number * 1e3:>12.3f}"
+            f" {time_automaton / number * 1e3:>15.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,79 @@
-def main():
-    with open("input.txt", "r") as fh:
-        final_sum = 0
+import sys
+from pathlib import Path
+from typing import Iterable
 
-        for line in fh.readlines():
-            numbers_in_line = [c for c in line if c.isdigit()]
+import numpy as np
 
-            if len(numbers_in_line) == 0:
-                continue
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
 
-            # Repeat the first digit if there is only one:
-            number_str = numbers_in_line[0] + numbers_in_line[-1]
+from aoc.loader import InputFile
 
-            number = int(number_str)
-            final_sum += number
 
-        print("Final sum:", final_sum)
+def get_sum_of_lines(lines: Iterable[str]) -> int:
+    """Get the sum of the calibration values by looping over the lines."""
+    final_sum = 0
+
+    for line in lines:
+        numbers_in_line = [c for c in line if c.isdigit()]
+
+        if len(numbers_in_line) == 0:
+            continue
+
+        # Repeat the first digit if there is only one:
+        number_str = numbers_in_line[0] + numbers_in_line[-1]
+
+        number = int(number_str)
+        final_sum += number
+
+    return final_sum
+
+
+def get_sum_of_buffer(buffer: np.ndarray) -> int:
+    """Get the sum of the calibration values of all lines at once.
+
+    Lines without digits are skipped, like in :func:`get_sum_of_lines`.
+
+    :param buffer: Flat `uint8` array of the complete file
+    """
+    digit_pos = np.flatnonzero((buffer >= ord("0")) & (buffer <= ord("9")))
+    if len(digit_pos) == 0:
+        return 0
+
+    # Line index of each digit, from the position of the newlines:
+    newline_pos = np.flatnonzero(buffer == ord("\n"))
+    digit_line = np.searchsorted(newline_pos, digit_pos)
+
+    new_line = digit_line[1:] != digit_line[:-1]  # Digit is in the next line
+    is_first = np.concatenate(([True], new_line))
+    is_last = np.concatenate((new_line, [True]))
+
+    digits = buffer[digit_pos].astype(np.int64) - ord("0")
+
+    return int(10 * digits[is_first].sum() + digits[is_last].sum())
+
+
+def parse(filename: str) -> np.ndarray:
+    with InputFile(filename) as input_file:
+        return input_file.array()
+
+
+def solve(buffer: np.ndarray) -> int:
+    return get_sum_of_buffer(buffer)
+
+
+def main(filename: str = "input.txt", validate: bool = False):
+    final_sum = solve(parse(filename))
+
+    if validate:
+        with open(filename, "r") as fh:
+            final_sum_lines = get_sum_of_lines(fh)
+
+        if final_sum != final_sum_lines:
+            raise RuntimeError(f"Sum {final_sum} of lines is {final_sum_lines}")
+
+    print("Final sum:", final_sum)
 
 
 if __name__ == "__main__":
-    main()
+    main(validate="--validate" in sys.argv)
@@ -1,5 +1,5 @@
-from typing import Dict
-
+from collections import deque
+from typing import Dict, List, Optional, Tuple, Iterable
 
 number_words = [
     "one",
@@ -42,27 +42,149 @@ def get_number_words_in_string(line: str) -> Dict[int, str]:
     return numbers
 
 
-def main():
-    with open("input.txt", "r") as fh:
-        final_sum = 0
+class Automaton:
+    """Aho-Corasick automaton, to find any of a set of words in a single scan.
+
+    The automaton is compiled into a complete transition table, so every character
+    costs a single dictionary lookup.
+    """
+
+    def __init__(self, words: Dict[str, str]):
+        """
+
+        :param words: `word: value` dict of the words to find
+        """
+        # Trie of all words, state 0 is the root:
+        self.transitions: List[Dict[str, int]] = [{}]
+        # Longest word ending in each state, as `(length, value)`:
+        self.matches: List[Optional[Tuple[int, str]]] = [None]
+
+        for word, value in words.items():
+            state = 0
+            for c in word:
+                if c not in self.transitions[state]:
+                    self.transitions.append({})
+                    self.matches.append(None)
+                    self.transitions[state][c] = len(self.transitions) - 1
+                state = self.transitions[state][c]
+            self.matches[state] = (len(word), value)
+
+        self.max_length = max(len(word) for word in words)
+
+        # Add the failure transitions, breadth-first such that the fallback state is
+        # always completed already:
+        fallback = [0] * len(self.transitions)
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for c, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                if state > 0:
+                    fallback[next_state] = self.transitions[fallback[state]].get(c, 0)
+                if self.matches[next_state] is None:
+                    self.matches[next_state] = self.matches[fallback[next_state]]
+
+            if state > 0:
+                # Missing transitions are those of the fallback state:
+                for c, next_state in self.transitions[fallback[state]].items():
+                    self.transitions[state].setdefault(c, next_state)
+
+    def find_first(self, line: str) -> Optional[str]:
+        """Get the value of the word that starts first in a line.
+
+        The scan stops as soon as no word could start any earlier.
+        """
+        transitions, matches = self.transitions, self.matches
+        state = 0
+        first_start = None
+        first_value = None
+        for pos, c in enumerate(line):
+            state = transitions[state].get(c, 0)
+            if (match := matches[state]) is not None:
+                start = pos - match[0] + 1
+                if first_start is None or start < first_start:
+                    first_start, first_value = start, match[1]
+            if first_start is not None and pos >= first_start + self.max_length - 2:
+                break  # Any other word would have to start later
+
+        return first_value
+
+    def find_first_ending(self, line: Iterable[str]) -> Optional[str]:
+        """Get the value of the word that ends first in a line.
+
+        The scan stops at the first match.
+        """
+        transitions, matches = self.transitions, self.matches
+        state = 0
+        for c in line:
+            state = transitions[state].get(c, 0)
+            if (match := matches[state]) is not None:
+                return match[1]
+
+        return None
+
+
+numbers_by_word = {word: str(i + 1) for i, word in enumerate(number_words)} | {
+    str(i): str(i) for i in range(10)
+}
+
+automaton_forward = Automaton(numbers_by_word)
+automaton_backward = Automaton({w[::-1]: v for w, v in numbers_by_word.items()})
+
+
+def get_first_and_last(line: str) -> Tuple[Optional[str], Optional[str]]:
+    """Get the first and last number (digit or word) of a line.
+
+    The last number is found by scanning the reversed line for reversed words. Words
+    may overlap, like "twone".
+    """
+    first = automaton_forward.find_first(line)
+    last = automaton_backward.find_first_ending(reversed(line))
+    return first, last
+
+
+def get_first_and_last_sorted(line: str) -> Tuple[Optional[str], Optional[str]]:
+    """Get the first and last number of a line by collecting and sorting all of them.
+
+    Slower alternative to :func:`get_first_and_last`.
+    """
+    numbers = get_numbers_in_string(line) | get_number_words_in_string(line)
+
+    if len(numbers) < 1:
+        return None, None
+
+    sorted_tuples = sorted(numbers.items(), key=lambda x: x[0])
+
+    return sorted_tuples[0][1], sorted_tuples[-1][1]
+
+
+def parse(filename: str) -> List[str]:
+    with open(filename, "r") as fh:
+        return fh.readlines()
+
+
+def solve(lines: List[str]) -> int:
+    final_sum = 0
+
+    for line in lines:
+        first, last = get_first_and_last(line)
 
-        for line in fh.readlines():
-            numbers = get_numbers_in_string(line) | get_number_words_in_string(line)
+        if first is None:
+            raise ValueError(f"Line {line} does not seem to have numbers!")
 
-            if len(numbers) < 1:
-                raise ValueError(f"Line {line} does not seem to have numbers!")
+        # Repeat the first digit if there is only one:
+        number_str = first + last
 
-            sorted_tuples = sorted(numbers.items(), key=lambda x: x[0])
+        number = int(number_str)
+        final_sum += number
 
-            numbers = [p[1] for p in sorted_tuples]
+    return final_sum
 
-            # Repeat the first digit if there is only one:
-            number_str = numbers[0] + numbers[-1]
 
-            number = int(number_str)
-            final_sum += number
+def main(filename: str = "input.txt"):
+    final_sum = solve(parse(filename))
 
-        print("Final sum:", final_sum)
+    print("Final sum:", final_sum)
 
 
 if __name__ == "__main__":
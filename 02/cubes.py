@@ -1,3 +1,9 @@
+from bisect import bisect_right
+from typing import List, Tuple, Iterable, NamedTuple, Optional
+
+import numpy as np
+
+
 def get_cube_sets(game_str: str):
     for draw_str in game_str.strip().split(";"):
         cube_set = {}
@@ -32,29 +38,221 @@ def get_game_power(options: dict, game_str: str):
     return value
 
 
-def main():
-    cube_max_counts = {
-        "red": 12,
-        "green": 13,
-        "blue": 14,
-    }
+CUBE_MAX_COUNTS = {
+    "red": 12,
+    "green": 13,
+    "blue": 14,
+}
+
+COLORS = tuple(CUBE_MAX_COUNTS.keys())
+
+
+def parse_game(line: str) -> Tuple[int, List[int]]:
+    """Get the game ID and the maximum count per color (in order of `COLORS`)."""
+    game_id_str, _, draws_str = line.partition(":")
+
+    maxima = [0] * len(COLORS)
+    for draw_str in draws_str.split(";"):
+        for cube_str in draw_str.split(","):
+            count_str, color = cube_str.split()
+            idx = COLORS.index(color)
+            maxima[idx] = max(maxima[idx], int(count_str))
+
+    return int(game_id_str[5:]), maxima
+
+
+class GameLog:
+    """Maximum cube counts per game, stored column-wise.
+
+    Once built, any set of limits is checked against all games at once.
+    """
+
+    def __init__(self, game_ids: np.ndarray, maxima: np.ndarray):
+        """
+
+        :param game_ids: Array of game IDs
+        :param maxima: 2D array of maximum cube count, as [game, color]
+        """
+        self.game_ids = game_ids
+        self.maxima = maxima
+
+    def __len__(self) -> int:
+        return len(self.game_ids)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "GameLog":
+        """Build a log, parsing each game line once."""
+        game_ids = []
+        maxima = []
+        for line in lines:
+            if not line.strip():
+                continue
+            game_id, game_maxima = parse_game(line)
+            game_ids.append(game_id)
+            maxima.append(game_maxima)
+
+        return cls(
+            np.array(game_ids, dtype=np.int64),
+            np.array(maxima, dtype=np.int64).reshape(-1, len(COLORS)),
+        )
+
+    def _get_limits_array(self, options: dict) -> np.ndarray:
+        return np.array([options[color] for color in COLORS], dtype=np.int64)
+
+    def get_possible(self, options: dict) -> np.ndarray:
+        """Get a mask of the games that are possible with the given maximum counts."""
+        return np.all(self.maxima <= self._get_limits_array(options), axis=1)
+
+    def get_possible_id_sum(self, options: dict) -> int:
+        return int(self.game_ids[self.get_possible(options)].sum())
+
+    def get_power_sum(self) -> int:
+        """Get the sum of the power (product of minimum cubes needed) of all games."""
+        return int(np.prod(self.maxima, axis=1).sum())
+
+
+class QueryResult(NamedTuple):
+    id_sum: int
+    count: int
+    game_ids: List[int]
+
+
+class GameIndex:
+    """Index over the color maxima of a game log, for many repeated limit queries.
+
+    A game is possible when each of its color maxima is within the limits, i.e. the
+    games are counted in a box of the (red, green, blue) space. The maxima per color
+    are compressed to their distinct values, and cumulative sums of the count and of
+    the IDs over all colors make this box a single table lookup.
+
+    The matching IDs are found from the color that excludes the most games: its games
+    sorted by value give the candidates, which are then checked on the other colors.
+    """
+
+    # Memory for both cumulative tables, above this only the sorted arrays are used
+    MAX_TABLE_BYTES = 32 << 20
+
+    def __init__(self, log: GameLog):
+        self.log = log
+
+        # Distinct values of each color, sorted:
+        self.values = [np.unique(log.maxima[:, c]) for c in range(len(COLORS))]
+
+        # Games sorted by each color:
+        self.order = [np.argsort(log.maxima[:, c]) for c in range(len(COLORS))]
+
+        # Plain lists, for a fast `bisect` of a single value:
+        self._values_lists = [v.tolist() for v in self.values]
+        self._sorted_maxima_lists = [
+            log.maxima[order, c].tolist() for c, order in enumerate(self.order)
+        ]
+
+        shape = tuple(len(v) for v in self.values)
+        self.count_table: Optional[np.ndarray] = None
+        self.id_sum_table: Optional[np.ndarray] = None
+        table_bytes = 2 * np.dtype(np.int64).itemsize * int(np.prod(shape))
+        if len(log) > 0 and table_bytes <= self.MAX_TABLE_BYTES:
+            coords = tuple(
+                np.searchsorted(self.values[c], log.maxima[:, c])
+                for c in range(len(COLORS))
+            )
+            self.count_table = np.zeros(shape, dtype=np.int64)
+            self.id_sum_table = np.zeros(shape, dtype=np.int64)
+            np.add.at(self.count_table, coords, 1)
+            np.add.at(self.id_sum_table, coords, log.game_ids)
+            for axis in range(len(COLORS)):
+                np.cumsum(self.count_table, axis=axis, out=self.count_table)
+                np.cumsum(self.id_sum_table, axis=axis, out=self.id_sum_table)
+
+    def _get_table_index(self, options: dict) -> Optional[Tuple[int, ...]]:
+        """Get the table cell of the given limits, `None` if no game fits."""
+        idx = tuple(
+            bisect_right(self._values_lists[c], options[color]) - 1
+            for c, color in enumerate(COLORS)
+        )
+        return None if min(idx) < 0 else idx
+
+    def count(self, options: dict) -> int:
+        """Get the number of games possible with the given maximum counts."""
+        if self.count_table is None:
+            return len(self.get_game_ids(options))
+
+        idx = self._get_table_index(options)
+        return 0 if idx is None else int(self.count_table[idx])
+
+    def id_sum(self, options: dict) -> int:
+        """Get the sum of the IDs of games possible with the given maximum counts."""
+        if self.id_sum_table is None:
+            return sum(self.get_game_ids(options))
+
+        idx = self._get_table_index(options)
+        return 0 if idx is None else int(self.id_sum_table[idx])
+
+    def get_game_ids(self, options: dict) -> List[int]:
+        """Get the sorted IDs of games possible with the given maximum counts."""
+        # Number of games within the limit, per color:
+        counts = [
+            bisect_right(self._sorted_maxima_lists[c], options[color])
+            for c, color in enumerate(COLORS)
+        ]
+        c = int(np.argmin(counts))
+        candidates = self.order[c][: counts[c]]
+
+        limits = np.array([options[color] for color in COLORS], dtype=np.int64)
+        possible = np.all(self.log.maxima[candidates] <= limits, axis=1)
+
+        return sorted(self.log.game_ids[candidates[possible]].tolist())
+
+    def query(self, options: dict) -> QueryResult:
+        """Get the ID sum, the count and the IDs of the possible games."""
+        game_ids = self.get_game_ids(options)
+        if self.count_table is None:
+            return QueryResult(
+                id_sum=sum(game_ids), count=len(game_ids), game_ids=game_ids
+            )
+
+        return QueryResult(
+            id_sum=self.id_sum(options),
+            count=self.count(options),
+            game_ids=game_ids,
+        )
+
+
+def parse(filename: str) -> GameLog:
+    with open(filename, "r") as fh:
+        return GameLog.from_lines(fh)
+
+
+def solve_by_lines(lines: Iterable[str]) -> Tuple[int, int]:
+    """Get both answers by parsing the draws of each line again, without a `GameLog`."""
+    possible_game_id_sum = 0
+    power_games_sum = 0
+
+    for line in lines:
+        game_id_str, _, draws_str = line.partition(":")
+
+        game_id = int(game_id_str[5:])
+
+        if check_game_is_possible(CUBE_MAX_COUNTS, draws_str):
+            possible_game_id_sum += game_id
+
+        power_games_sum += get_game_power(CUBE_MAX_COUNTS, draws_str)
+
+    return possible_game_id_sum, power_games_sum
 
-    with open("input.txt", "r") as fh:
-        possible_game_id_sum = 0
-        power_games_sum = 0
 
-        while (line := fh.readline()) != "":
-            game_id_str, _, draws_str = line.partition(":")
+def solve(log: GameLog) -> Tuple[int, int]:
+    possible_game_id_sum = log.get_possible_id_sum(CUBE_MAX_COUNTS)
+    power_games_sum = log.get_power_sum()
 
-            game_id = int(game_id_str[5:])
+    return possible_game_id_sum, power_games_sum
 
-            if check_game_is_possible(cube_max_counts, draws_str):
-                possible_game_id_sum += game_id
 
-            power_games_sum += get_game_power(cube_max_counts, draws_str)
+def main(filename: str = "input.txt"):
+    possible_game_id_sum, power_games_sum = solve(parse(filename))
 
-        print("Sum of possible games:", possible_game_id_sum)
-        print("Sum of power of all games:", power_games_sum)
+    print("Sum of possible games:", possible_game_id_sum)
+    print("Sum of power of all games:", power_games_sum)
 
 
 if __name__ == "__main__":
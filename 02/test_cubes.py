@@ -0,0 +1,59 @@
+import itertools
+import unittest
+
+from cubes import COLORS, GameIndex, GameLog, parse
+
+
+class ScanIndex(GameIndex):
+    MAX_TABLE_BYTES = 0  # Always use the sorted arrays
+
+
+class Day02TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.log = parse("input.txt")
+
+        limits = [0, 1, 5, 12, 13, 14, 20]
+        self.options = [
+            dict(zip(COLORS, values))
+            for values in itertools.product(limits, repeat=len(COLORS))
+        ]
+
+    def test_query(self):
+        table_index = GameIndex(self.log)
+        scan_index = ScanIndex(self.log)
+        self.assertIsNotNone(table_index.count_table)
+        self.assertIsNone(scan_index.count_table)
+
+        for options in self.options:
+            possible = self.log.get_possible(options)
+            game_ids = sorted(self.log.game_ids[possible].tolist())
+            expected = (sum(game_ids), len(game_ids), game_ids)
+
+            for index in (table_index, scan_index):
+                with self.subTest(options=options, index=type(index).__name__):
+                    self.assertEqual(expected, tuple(index.query(options)))
+                    self.assertEqual(expected[0], index.id_sum(options))
+                    self.assertEqual(expected[1], index.count(options))
+
+    def test_below_all_maxima(self):
+        options = dict.fromkeys(COLORS, 0)
+        for index in (GameIndex(self.log), ScanIndex(self.log)):
+            self.assertEqual((0, 0, []), tuple(index.query(options)))
+
+    def test_example(self):
+        lines = [
+            "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green",
+            "Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue",
+            "Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red",
+            "Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red",
+            "Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green",
+        ]
+        log = GameLog.from_lines(lines)
+        options = {"red": 12, "green": 13, "blue": 14}
+        for index in (GameIndex(log), ScanIndex(log)):
+            self.assertEqual((8, 3, [1, 2, 5]), tuple(index.query(options)))
+
+
+if __name__ == "__main__":
+    unittest.main()
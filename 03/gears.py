@@ -1,5 +1,17 @@
-from typing import List
+import itertools
 import re
+import sys
+from bisect import bisect_right
+from collections import deque
+from pathlib import Path
+from typing import List, Tuple, NamedTuple, Optional, Iterable, Deque
+
+import numpy as np
+
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
+
+from aoc.loader import read_grid
 
 
 def find_whole_numbers(line: str, pos: int) -> List[int]:
@@ -41,12 +53,10 @@ def find_whole_numbers(line: str, pos: int) -> List[int]:
     return numbers
 
 
-def main():
+def get_sums_of_lines(lines: List[str]) -> Tuple[int, int]:
+    """Get the sum of part numbers and of gear ratios, by scanning the lines."""
     re_numbers = re.compile(r"[0-9]+")  # A single or more digits
 
-    with open("input.txt", "r") as fh:
-        lines = fh.readlines()
-
     part_sum = 0
     gear_ratio_sum = 0
 
@@ -88,10 +98,182 @@ def main():
             elif len(numbers) > 2:
                 raise ValueError(f"More than two numbers found in line {idx}:{pos}")
 
+    return part_sum, gear_ratio_sum
+
+
+def get_sums_of_grid(grid: np.ndarray) -> Tuple[int, int]:
+    """Get the sum of part numbers and of gear ratios, from a 2D character array.
+
+    Each number is labelled once, after which the adjacency of symbols is found for
+    all cells at once with shifted masks.
+
+    :param grid: 2D `uint8` array of characters, as [row, col]
+    """
+    rows, cols = grid.shape
+    is_digit = (grid >= ord("0")) & (grid <= ord("9"))
+    is_symbol = ~is_digit & (grid != ord("."))
+
+    # Label each run of digits, 1-indexed, in reading order:
+    is_start = is_digit.copy()
+    is_start[:, 1:] &= ~is_digit[:, :-1]
+    labels = np.cumsum(is_start, dtype=np.int32)
+    labels = labels.reshape(rows, cols)
+    labels[~is_digit] = 0
+    number_count = int(labels.max()) if labels.size else 0
+
+    # Value of each label, by weighing the digits by their position from the end:
+    digit_idx = np.flatnonzero(is_digit)
+    digit_labels = labels.ravel()[digit_idx]
+    is_end = np.ones(len(digit_idx), dtype=bool)
+    is_end[:-1] = digit_labels[1:] != digit_labels[:-1]
+    end_idx = digit_idx[is_end]  # Position of the last digit of each label
+    powers = end_idx[digit_labels - 1] - digit_idx
+    weighted = (grid.ravel()[digit_idx] - ord("0")) * np.power(10, powers)
+    starts = np.flatnonzero(np.concatenate(([True], is_end[:-1])))
+    values = np.zeros(number_count + 1, dtype=np.int64)  # Index 0 is not a number
+    if number_count:
+        values[1:] = np.add.reduceat(weighted, starts)
+
+    # Mark each cell next to a symbol, by shifting the symbols around:
+    padded = np.pad(is_symbol, 1)
+    near_symbol = np.zeros_like(is_symbol)
+    for d_row in (0, 1, 2):
+        for d_col in (0, 1, 2):
+            near_symbol |= padded[d_row : d_row + rows, d_col : d_col + cols]
+
+    is_part = np.zeros(number_count + 1, dtype=bool)
+    is_part[labels[near_symbol & is_digit]] = True
+    part_sum = int(values[is_part].sum())
+
+    # Collect the labels surrounding each gear:
+    star_rows, star_cols = np.nonzero(grid == ord("*"))
+    labels_padded = np.pad(labels, 1)
+    around = np.stack(
+        [
+            labels_padded[star_rows + d_row, star_cols + d_col]
+            for d_row in (0, 1, 2)
+            for d_col in (0, 1, 2)
+        ],
+        axis=1,
+    )
+    around.sort(axis=1)
+    is_new = np.ones_like(around, dtype=bool)
+    is_new[:, 1:] = around[:, 1:] != around[:, :-1]
+    number_counts = np.count_nonzero(is_new & (around > 0), axis=1)
+
+    if np.any(number_counts > 2):
+        row, col = star_rows[number_counts > 2][0], star_cols[number_counts > 2][0]
+        raise ValueError(f"More than two numbers found in line {row}:{col}")
+
+    gears = around[number_counts == 2]
+    first = np.where(gears > 0, gears, number_count + 1).min(axis=1)
+    second = gears[:, -1]
+    gear_ratio_sum = int(np.sum(values[first] * values[second]))
+
+    return part_sum, gear_ratio_sum
+
+
+class Row(NamedTuple):
+    """A single line of the schematic, with the numbers in it."""
+
+    line: str
+    starts: List[int]  # First position of each number
+    ends: List[int]  # Position after each number
+    values: List[int]
+
+    @classmethod
+    def from_line(cls, line: str) -> "Row":
+        line = line.rstrip("\r\n")
+        starts, ends, values = [], [], []
+        for m in RE_NUMBERS.finditer(line):
+            starts.append(m.start())
+            ends.append(m.end())
+            values.append(int(m.group()))
+
+        return cls(line, starts, ends, values)
+
+    def get_numbers_near(self, pos: int) -> List[int]:
+        """Get the numbers within a distance of 1 of a position."""
+        numbers = []
+        idx = bisect_right(self.starts, pos + 1) - 1  # Last number starting in reach
+        while idx >= 0 and self.ends[idx] >= pos:
+            numbers.append(self.values[idx])
+            idx -= 1
+
+        return numbers
+
+
+RE_NUMBERS = re.compile(r"[0-9]+")  # A single or more digits
+
+NORMAL_CHARS = set("0123456789.")
+
+
+def get_row_sums(
+    row_prev: Optional[Row], row: Row, row_next: Optional[Row]
+) -> Tuple[int, int]:
+    """Get the sum of part numbers and of gear ratios, of the middle of three rows."""
+    rows = [r for r in (row_prev, row, row_next) if r is not None]
+
+    part_sum = 0
+    for start, end, value in zip(row.starts, row.ends, row.values):
+        for r in rows:
+            if not set(r.line[max(start - 1, 0) : end + 1]) <= NORMAL_CHARS:
+                part_sum += value
+                break
+
+    gear_ratio_sum = 0
+    pos = -1
+    while (pos := row.line.find("*", pos + 1)) >= 0:
+        numbers = [n for r in rows for n in r.get_numbers_near(pos)]
+
+        if len(numbers) == 2:
+            gear_ratio_sum += numbers[0] * numbers[1]
+        elif len(numbers) > 2:
+            raise ValueError(f"More than two numbers found in line {row.line}:{pos}")
+
+    return part_sum, gear_ratio_sum
+
+
+def get_sums_of_stream(lines: Iterable[str]) -> Tuple[int, int]:
+    """Get the sum of part numbers and of gear ratios, keeping only three rows.
+
+    Each row is handled as soon as the row below it came in, so any number of lines
+    can be streamed through in constant memory.
+    """
+    window: Deque[Optional[Row]] = deque([None, None], maxlen=3)
+
+    part_sum = 0
+    gear_ratio_sum = 0
+
+    for line in itertools.chain(lines, [None]):  # Trailing `None` for the last row
+        window.append(Row.from_line(line) if line is not None else None)
+
+        if window[1] is not None:
+            row_part_sum, row_gear_ratio_sum = get_row_sums(*window)
+            part_sum += row_part_sum
+            gear_ratio_sum += row_gear_ratio_sum
+
+    return part_sum, gear_ratio_sum
+
+
+def parse(filename: str) -> np.ndarray:
+    return read_grid(filename)
+
+
+def solve(grid: np.ndarray) -> Tuple[int, int]:
+    return get_sums_of_grid(grid)
+
+
+def main(filename: str = "input.txt"):
+    if filename == "-":
+        part_sum, gear_ratio_sum = get_sums_of_stream(sys.stdin)
+    else:
+        part_sum, gear_ratio_sum = solve(parse(filename))
+
     print("Sum of part numbers:", part_sum)
 
     print("Sum of gear products:", gear_ratio_sum)
 
 
 if __name__ == "__main__":
-    main()
+    main(*sys.argv[1:])  # Pass "-" to stream the schematic from stdin
@@ -1,4 +1,13 @@
-from typing import Set
+import sys
+from pathlib import Path
+from typing import Set, List, Tuple
+
+import numpy as np
+
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
+
+from aoc.loader import read_grid
 
 
 def numbers_to_set(txt: str) -> Set[int]:
@@ -7,23 +16,125 @@ def numbers_to_set(txt: str) -> Set[int]:
     return set(numbers)
 
 
-def main():
+def get_total_points_of_lines(lines: List[str]) -> int:
+    """Get the total points by intersecting sets of numbers, line by line."""
     total_points = 0
 
-    with open("input.txt", "r") as fh:
-        while (line := fh.readline()) != "":
-            _, _, line_numbers = line.partition(":")
-            numbers_left, _, numbers_right = line_numbers.partition("|")
+    for line in lines:
+        _, _, line_numbers = line.partition(":")
+        numbers_left, _, numbers_right = line_numbers.partition("|")
+
+        numbers_winning = numbers_to_set(numbers_left)
+        numbers_card = numbers_to_set(numbers_right)
+
+        wins = len(
+            numbers_winning & numbers_card
+        )  # Get length of the union of both sets
+
+        if wins > 0:
+            total_points += 2 ** (wins - 1)
+
+    return total_points
+
+
+def parse_fixed_width(block: np.ndarray) -> np.ndarray:
+    """Get the right-aligned numbers of a block of characters, as [row, field].
+
+    Fields are the columns in between columns that are blank for every row.
+    """
+    is_digit = (block >= ord("0")) & (block <= ord("9"))
+    digits = np.where(is_digit, block - ord("0"), 0).astype(np.int64)
+
+    is_used = np.concatenate(([False], is_digit.any(axis=0), [False]))
+    changes = np.flatnonzero(is_used[1:] != is_used[:-1])
+    starts, ends = changes[::2], changes[1::2]
+
+    numbers = np.zeros((block.shape[0], len(starts)), dtype=np.int64)
+    for field, (start, end) in enumerate(zip(starts, ends)):
+        if np.any(is_digit[:, start : end - 1] & ~is_digit[:, start + 1 : end]):
+            raise ValueError("Numbers are not right-aligned")
+        if not np.all(is_digit[:, end - 1]):
+            raise ValueError("Numbers are missing")
+
+        for col in range(start, end):
+            numbers[:, field] = numbers[:, field] * 10 + digits[:, col]
+
+    return numbers
+
+
+def get_card_numbers(grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the winning numbers and the numbers you have, as [card, number].
+
+    :param grid: 2D `uint8` array of the characters of all cards
+    """
+    colon = int(np.flatnonzero(grid[0] == ord(":"))[0])
+    bar = int(np.flatnonzero(grid[0] == ord("|"))[0])
+    if np.any(grid[:, colon] != ord(":")) or np.any(grid[:, bar] != ord("|")):
+        raise ValueError("Cards are not of the same layout")
+
+    return parse_fixed_width(grid[:, colon + 1 : bar]), parse_fixed_width(
+        grid[:, bar + 1 :]
+    )
+
+
+def to_bitmasks(numbers: np.ndarray, words: int) -> np.ndarray:
+    """Encode the numbers of each row as a bitmask, spread over 64-bit words.
+
+    :return: Array as [row, word]
+    """
+    masks = np.zeros((numbers.shape[0], words), dtype=np.uint64)
+    word_idx = numbers // 64
+    bits = np.left_shift(np.uint64(1), (numbers % 64).astype(np.uint64))
+    for word in range(words):
+        masks[:, word] = np.bitwise_or.reduce(
+            np.where(word_idx == word, bits, np.uint64(0)), axis=1
+        )
+
+    return masks
+
+
+def popcount(values: np.ndarray) -> np.ndarray:
+    """Count the bits set in each element of an unsigned integer array."""
+    if hasattr(np, "bitwise_count"):  # Since numpy 2.0
+        return np.bitwise_count(values)
+
+    as_bytes = values.view(np.uint8).reshape(values.shape + (values.itemsize,))
+    return POPCOUNT_TABLE[as_bytes].sum(axis=-1)
+
+
+POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def get_win_counts(winning: np.ndarray, card: np.ndarray) -> np.ndarray:
+    """Get the number of winning numbers of each card, for all cards at once.
+
+    Both sides are encoded as bitmasks (128 bits for numbers below 128), after which
+    the count is the number of bits set in their intersection.
+    """
+    largest = max(winning.max(initial=0), card.max(initial=0))
+    words = max(2, int(largest) // 64 + 1)
+
+    common = to_bitmasks(winning, words) & to_bitmasks(card, words)
+    return popcount(common).sum(axis=1, dtype=np.int64)
+
+
+def get_total_points(wins: np.ndarray) -> int:
+    """Get the total points, from the number of wins per card."""
+    points = np.where(wins > 0, np.left_shift(1, np.maximum(wins - 1, 0)), 0)
+    return int(points.sum())
+
+
+def parse(filename: str) -> Tuple[np.ndarray, np.ndarray]:
+    return get_card_numbers(read_grid(filename))
+
 
-            numbers_winning = numbers_to_set(numbers_left)
-            numbers_card = numbers_to_set(numbers_right)
+def solve(card_numbers: Tuple[np.ndarray, np.ndarray]) -> int:
+    wins = get_win_counts(*card_numbers)
+    return get_total_points(wins)
 
-            wins = len(
-                numbers_winning & numbers_card
-            )  # Get length of the union of both sets
 
-            if wins > 0:
-                total_points += 2 ** (wins - 1)
+def main(filename: str = "input.txt"):
+    total_points = solve(parse(filename))
 
     print("Total points worth:", total_points)
 
@@ -1,5 +1,9 @@
-from collections import defaultdict
-from typing import Set, Dict
+from collections import defaultdict, deque
+from typing import Set, Deque, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from scratchcards import get_win_counts, parse  # Both parts read the same cards
 
 
 def numbers_to_set(txt: str) -> Set[int]:
@@ -8,34 +12,106 @@ def numbers_to_set(txt: str) -> Set[int]:
     return set(numbers)
 
 
-def main():
+def get_total_cards_of_lines(lines: List[str]) -> int:
+    """Get the total number of cards by intersecting sets of numbers, line by line."""
     total_cards = 0
 
     # How many copies we encountered of a given card
     card_copies: Dict[int, int] = defaultdict(lambda: 1)  # Always at least one copy
 
-    with open("input.txt", "r") as fh:
-        while (line := fh.readline()) != "":
-            card_str, _, line_numbers = line.partition(":")
+    for line in lines:
+        card_str, _, line_numbers = line.partition(":")
+
+        card = int(card_str[4:])
+
+        card_count = card_copies[card]  # How many copies we have of this card
+
+        total_cards += card_count
+
+        numbers_left, _, numbers_right = line_numbers.partition("|")
+
+        numbers_winning = numbers_to_set(numbers_left)
+        numbers_card = numbers_to_set(numbers_right)
+
+        wins = len(
+            numbers_winning & numbers_card
+        )  # Get length of the union of both sets
+
+        if wins > 0:
+            for next_card in range(card + 1, card + wins + 1):
+                card_copies[next_card] += card_count
+
+    return total_cards
+
+
+def get_total_cards(wins: np.ndarray) -> int:
+    """Get the total number of cards, from the number of wins per card.
+
+    Instead of adding copies to every won card, the copies are added to a difference
+    array at the first won card and removed again after the last one. A running sum
+    over that array gives the copies of each card, in a single pass.
+    """
+    count = len(wins)
+    changes = [0] * (count + 1)
+    running = 0  # Extra copies won for the current card
+    total_cards = 0
+
+    for card, card_wins in enumerate(wins.tolist()):
+        running += changes[card]
+        copies = 1 + running
+        total_cards += copies
+
+        if card_wins > 0:
+            changes[card + 1] += copies
+            changes[min(card + card_wins + 1, count)] -= copies
+
+    return total_cards
+
+
+class CardCounter:
+    """Running count of cards, for a feed where cards keep being appended.
+
+    Only the pending changes for upcoming cards are kept, as a queue that starts
+    at the next card.
+    """
+
+    def __init__(self):
+        self.total = 0  # Total number of cards so far
+        self.cards = 0  # Number of original cards appended
+        self._running = 0
+        self._changes: Deque[int] = deque()
+
+    def append(self, wins: int) -> int:
+        """Add the next card by its number of wins, return its number of copies."""
+        if self._changes:
+            self._running += self._changes.popleft()
+
+        copies = 1 + self._running
+        self.total += copies
+        self.cards += 1
 
-            card = int(card_str[4:])
+        if wins > 0:
+            if len(self._changes) <= wins:
+                self._changes.extend([0] * (wins + 1 - len(self._changes)))
+            self._running += copies  # Starting with the next card
+            self._changes[wins] -= copies  # Stop after the last won card
 
-            card_count = card_copies[card]  # How many copies we have of this card
+        return copies
 
-            total_cards += card_count
+    def extend(self, wins: Iterable[int]) -> int:
+        """Add a sequence of cards, return the new total."""
+        for card_wins in wins:
+            self.append(card_wins)
+        return self.total
 
-            numbers_left, _, numbers_right = line_numbers.partition("|")
 
-            numbers_winning = numbers_to_set(numbers_left)
-            numbers_card = numbers_to_set(numbers_right)
+def solve(card_numbers: Tuple[np.ndarray, np.ndarray]) -> int:
+    wins = get_win_counts(*card_numbers)
+    return get_total_cards(wins)
 
-            wins = len(
-                numbers_winning & numbers_card
-            )  # Get length of the union of both sets
 
-            if wins > 0:
-                for next_card in range(card + 1, card + wins + 1):
-                    card_copies[next_card] += card_count
+def main(filename: str = "input.txt"):
+    total_cards = solve(parse(filename))
 
     print("Total cards:", total_cards)
 
@@ -0,0 +1,49 @@
+import random
+import unittest
+
+import numpy as np
+
+from scratchcards import get_win_counts
+from scratchcards_2 import (
+    CardCounter,
+    get_total_cards,
+    get_total_cards_of_lines,
+    parse,
+)
+
+
+class Day04Part2TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.wins = get_win_counts(*parse("input.txt"))
+        with open("input.txt", "r") as fh:
+            self.lines = fh.readlines()
+
+    def test_input(self):
+        expected = get_total_cards_of_lines(self.lines)
+        self.assertEqual(10212704, expected)
+        self.assertEqual(expected, get_total_cards(self.wins))
+        self.assertEqual(expected, CardCounter().extend(self.wins.tolist()))
+
+    def test_append(self):
+        counter = CardCounter()
+        for n, card_wins in enumerate(self.wins.tolist(), start=1):
+            total = counter.total
+            copies = counter.append(card_wins)
+            self.assertEqual(total + copies, counter.total)
+            self.assertEqual(get_total_cards(self.wins[:n]), counter.total)
+            self.assertEqual(n, counter.cards)
+
+    def test_random(self):
+        rng = random.Random(4)
+        for _ in range(100):
+            wins = np.array([rng.randint(0, 6) for _ in range(rng.randint(0, 30))])
+            counter = CardCounter()
+            for n, card_wins in enumerate(wins.tolist(), start=1):
+                counter.append(card_wins)
+                self.assertEqual(get_total_cards(wins[:n]), counter.total)
+            self.assertEqual(get_total_cards(wins), CardCounter().extend(wins))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,39 +1,98 @@
-from typing import Dict
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
 
+import numpy as np
 
-def main():
-    # Keep track of each kind of mapping for each seed (so discarding intermediate
-    # maps)
-    seeds_to_dst: Dict[int, int]
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
+
+from aoc.loader import read_blocks
+
+Section = List[Tuple[int, int, int]]  # List of `(dst_start, src_start, length)`
+SectionArrays = Tuple[np.ndarray, np.ndarray, np.ndarray]  # Starts, ends and offsets
+
+
+def parse(filename: str) -> Tuple[List[int], Dict[str, Section]]:
+    """Get the list of seeds and the mapping lines by section title."""
+    sections: Dict[str, Section] = {}
+
+    (seeds_line,), *blocks = read_blocks(filename)
+    seeds = [int(s) for s in seeds_line.tobytes().partition(b":")[2].split()]
 
-    with open("input.txt", "r") as fh:
-        line = fh.readline()
-        seeds = [int(s) for s in line.partition(":")[2].split()]
-        seeds_to_dst = {s: s for s in seeds}
-        seeds_to_dst_new = dict(seeds_to_dst)
+    for title_line, *lines in blocks:
+        title = title_line.tobytes().decode().partition(" ")[0]
+        sections[title] = []
 
-        while (line := fh.readline()) != "":
-            if line.strip() == "":
-                title = fh.readline().partition(" ")[0]  # Next line contains title
-                print("Section:", title)
-                seeds_to_dst = dict(seeds_to_dst_new)
-                continue
+        for line in lines:
+            dst_start, src_start, length = [int(s) for s in line.tobytes().split()]
+            sections[title].append((dst_start, src_start, length))
 
-            numbers = [int(s) for s in line.strip().split()]
+    return seeds, sections
 
-            dst_start, src_start, length = numbers
 
+def solve_by_dict(almanac: Tuple[List[int], Dict[str, Section]]) -> int:
+    seeds, sections = almanac
+
+    # Keep track of each kind of mapping for each seed (so discarding intermediate
+    # maps)
+    seeds_to_dst: Dict[int, int] = {s: s for s in seeds}
+    seeds_to_dst_new = dict(seeds_to_dst)
+
+    for title, section in sections.items():
+        print("Section:", title)
+        seeds_to_dst = dict(seeds_to_dst_new)
+
+        for dst_start, src_start, length in section:
             for seed, dst in seeds_to_dst.items():
                 if src_start <= dst < src_start + length:
                     # If this key is in the source range:
                     seeds_to_dst_new[seed] = dst_start + dst - src_start
-                    pass
 
-            pass
+    seeds_to_dst = dict(seeds_to_dst_new)
+
+    return min(seeds_to_dst.values())
+
+
+def section_to_arrays(section: Section) -> SectionArrays:
+    """Get the source starts, source ends and offsets of a section, sorted by start."""
+    lines = np.array(sorted(section, key=lambda line: line[1]), dtype=np.int64)
+    lines = lines.reshape(-1, 3)
+    dst_start, src_start, length = lines.T
+    return src_start, src_start + length, dst_start - src_start
+
+
+def map_section(values: np.ndarray, arrays: SectionArrays) -> np.ndarray:
+    """Put an array of values through a section, see `section_to_arrays`."""
+    src_start, src_end, offset = arrays
+    if len(src_start) == 0:
+        return values  # No mapping lines, everything maps to itself
+
+    # Index of the last mapping starting at or before each value:
+    i = np.searchsorted(src_start, values, side="right") - 1
+    inside = (i >= 0) & (values < src_end[np.maximum(i, 0)])
+
+    values = values.copy()
+    values[inside] += offset[i[inside]]
+    return values
+
+
+def solve(almanac: Tuple[List[int], Dict[str, Section]]) -> int:
+    seeds, sections = almanac
+
+    # Convert every section only once:
+    stages = [section_to_arrays(section) for section in sections.values()]
+
+    values = np.array(seeds, dtype=np.int64)
+
+    for arrays in stages:
+        values = map_section(values, arrays)
+
+    return int(values.min())
 
-        seeds_to_dst = dict(seeds_to_dst_new)
 
-    lowest_location = min(seeds_to_dst.values())
+def main(filename: str = "input.txt"):
+    lowest_location = solve(parse(filename))
 
     print("The lowest value for location is:", lowest_location)
 
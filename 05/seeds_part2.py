@@ -1,5 +1,14 @@
+import asyncio
+import sys
+from bisect import bisect_right
 from collections import OrderedDict
-from typing import List, Dict, Tuple, Optional
+from pathlib import Path
+from typing import List, Dict, Iterable, Tuple, Optional
+
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
+
+from aoc.loader import read_blocks
 
 
 class Mapping:
@@ -116,30 +125,138 @@ class Range:
         return current_ranges + new_ranges
 
 
-def main():
-    # --- Parse input ---
+class PiecewiseMap:
+    """Maps all values through sorted, non-overlapping segments with an offset each.
+
+    Segment `i` covers `starts[i]` up to (excluding) `starts[i + 1]`, the last one
+    continues indefinitely. Values not covered by any mapping get an offset of 0, so
+    the segments always cover everything from 0.
+    """
+
+    def __init__(self, starts: List[int], offsets: List[int]):
+        if not starts or starts[0] != 0 or len(starts) != len(offsets):
+            raise ValueError("Segments must start at 0 and have an offset each")
+
+        self.starts = starts
+        self.offsets = offsets
+
+    def __repr__(self):
+        return " ".join(f"{s}:{o:+}" for s, o in zip(self.starts, self.offsets))
+
+    def __len__(self):
+        return len(self.starts)
+
+    @staticmethod
+    def from_mappings(mappings: List[Mapping]) -> "PiecewiseMap":
+        """Make a map out of a stage of mappings, filling the gaps in between."""
+        starts = [0]
+        offsets = [0]
+
+        for mapping in sorted(mappings, key=lambda m: m.src_start):
+            offset = mapping.dst_start - mapping.src_start
+            if mapping.src_start == starts[-1]:
+                offsets[-1] = offset  # Replace the empty gap
+            else:
+                starts.append(mapping.src_start)
+                offsets.append(offset)
+
+            starts.append(mapping.src_end + 1)  # Gap after this mapping
+            offsets.append(0)
+
+        return PiecewiseMap(starts, offsets).merged()
+
+    def merged(self) -> "PiecewiseMap":
+        """Get a copy where neighbouring segments with the same offset are joined."""
+        starts = [self.starts[0]]
+        offsets = [self.offsets[0]]
+
+        for start, offset in zip(self.starts[1:], self.offsets[1:]):
+            if offset != offsets[-1]:
+                starts.append(start)
+                offsets.append(offset)
+
+        return PiecewiseMap(starts, offsets)
+
+    def get_segment(self, value: int) -> int:
+        """Get the index of the segment containing a value."""
+        return bisect_right(self.starts, value) - 1
+
+    def __call__(self, value: int) -> int:
+        return value + self.offsets[self.get_segment(value)]
+
+    def then(self, other: "PiecewiseMap") -> "PiecewiseMap":
+        """Compose with a next stage, resulting in a single map that does both."""
+        starts = []
+        offsets = []
+
+        for i, (start, offset) in enumerate(zip(self.starts, self.offsets)):
+            starts.append(start)
+            j = other.get_segment(start + offset)
+            offsets.append(offset + other.offsets[j])
+
+            # Split where the mapped values cross a segment border of `other`:
+            end = self.starts[i + 1] if i + 1 < len(self.starts) else None
+            for other_start, other_offset in zip(
+                other.starts[j + 1 :], other.offsets[j + 1 :]
+            ):
+                if end is not None and other_start >= end + offset:
+                    break
+                starts.append(other_start - offset)
+                offsets.append(offset + other_offset)
+
+        return PiecewiseMap(starts, offsets).merged()
+
+    def apply_range(self, value_range: Range) -> List[Range]:
+        """Put a range of values through this map, in one sweep over the segments."""
+        new_ranges = []
+        i = self.get_segment(value_range.start)
+        start = value_range.start
+
+        while start <= value_range.end:
+            end = value_range.end
+            if i + 1 < len(self.starts):
+                end = min(end, self.starts[i + 1] - 1)
 
-    # Keep track of source-to-destination mappings:
+            new_ranges.append(Range(start + self.offsets[i], end=end + self.offsets[i]))
+            start = end + 1
+            i += 1
+
+        return new_ranges
+
+    def get_lowest(self, value_range: Range) -> int:
+        """Get the lowest result for a range of values.
+
+        Inside a segment values only increase, so only the start of each piece needs
+        checking.
+        """
+        return min(r.start for r in self.apply_range(value_range))
+
+
+Almanac = Tuple[List[Range], OrderedDict[str, List[Mapping]]]
+
+
+def parse(filename: str) -> Almanac:
+    """Get the seed ranges and the source-to-destination mappings per stage."""
     seed_ranges: List[Range] = []
     mappings_per_stage: OrderedDict[str, List[Mapping]] = OrderedDict()
 
-    with open("input.txt", "r") as fh:
-        line = fh.readline()
-        seeds = [int(s) for s in line.partition(":")[2].split()]
+    (seeds_line,), *blocks = read_blocks(filename)
+    seeds = [int(s) for s in seeds_line.tobytes().partition(b":")[2].split()]
+
+    for i in range(0, len(seeds) - 1, 2):
+        seed_ranges.append(Range(seeds[i], seeds[i + 1]))
 
-        for i in range(0, len(seeds) - 1, 2):
-            seed_ranges.append(Range(seeds[i], seeds[i + 1]))
+    for title_line, *lines in blocks:
+        title = title_line.tobytes().decode().partition(" ")[0]
+        mappings_per_stage[title] = [
+            Mapping.from_string(line.tobytes().decode()) for line in lines
+        ]
 
-        while (line := fh.readline()) != "":
-            if line.strip() == "":
-                title = fh.readline().partition(" ")[0]  # Next line contains title
-                mappings_per_stage[title] = []
-                continue  # Skip rest of outer loop
+    return seed_ranges, mappings_per_stage
 
-            new_map = Mapping.from_string(line)
-            mappings_per_stage[title].append(new_map)
 
-    # --- Parse input ---
+def solve_by_stage(almanac: Almanac) -> int:
+    seed_ranges, mappings_per_stage = almanac
 
     seed_ranges_before = seed_ranges
 
@@ -155,9 +272,97 @@ def main():
 
     start_numbers = [r.start for r in seed_ranges_before]
 
-    print("Lowest location number:", min(start_numbers))
+    return min(start_numbers)
+
+
+def compose_stages(mappings_per_stage: OrderedDict[str, List[Mapping]]) -> PiecewiseMap:
+    """Compose the mappings of all stages into a single map, from seed to location."""
+    full_map = PiecewiseMap([0], [0])
+
+    for mappings in mappings_per_stage.values():
+        full_map = full_map.then(PiecewiseMap.from_mappings(mappings))
+
+    return full_map
+
+
+class LocationIndex:
+    """Answers location queries for an almanac that is fixed, built once.
+
+    All stages are composed into a single map. The lowest location of each segment
+    is at its start, and a sparse table over these lowest values gives the minimum
+    over any run of whole segments in constant time.
+
+    Instances are not modified after construction, so they can be shared between
+    threads.
+    """
+
+    def __init__(self, mappings_per_stage: OrderedDict[str, List[Mapping]]):
+        self.map = compose_stages(mappings_per_stage)
+
+        # Level `k` holds the minimum of `2**k` segments, starting at each segment
+        lowest = [s + o for s, o in zip(self.map.starts, self.map.offsets)]
+        self._table = [lowest]
+        width = 1
+        while 2 * width <= len(lowest):
+            previous = self._table[-1]
+            level = [
+                min(previous[i], previous[i + width])
+                for i in range(len(lowest) - 2 * width + 1)
+            ]
+            self._table.append(level)
+            width *= 2
+
+    def _get_segments_min(self, first: int, last: int) -> int:
+        """Get the lowest location over segments `first` to `last` (inclusive)."""
+        k = (last - first + 1).bit_length() - 1
+        level = self._table[k]
+        return min(level[first], level[last - (1 << k) + 1])
+
+    def location(self, seed: int) -> int:
+        """Get the location of a single seed."""
+        return self.map(seed)
+
+    def lowest_location(self, seed_range: Range) -> int:
+        """Get the lowest location for a range of seeds."""
+        first = self.map.get_segment(seed_range.start)
+        last = self.map.get_segment(seed_range.end)
+
+        lowest = seed_range.start + self.map.offsets[first]
+        if last > first:
+            # Every later segment is entered at its start:
+            lowest = min(lowest, self._get_segments_min(first + 1, last))
+
+        return lowest
+
+    def locations(self, seeds: Iterable[int]) -> List[int]:
+        """Get the location of each seed in a batch."""
+        return [self.map(seed) for seed in seeds]
+
+    def lowest_locations(self, seed_ranges: Iterable[Range]) -> int:
+        """Get the lowest location over a batch of seed ranges."""
+        return min(self.lowest_location(r) for r in seed_ranges)
+
+    async def locations_async(self, seeds: Iterable[int]) -> List[int]:
+        """Like `locations`, but run in a worker thread."""
+        return await asyncio.to_thread(self.locations, list(seeds))
+
+    async def lowest_locations_async(self, seed_ranges: Iterable[Range]) -> int:
+        """Like `lowest_locations`, but run in a worker thread."""
+        return await asyncio.to_thread(self.lowest_locations, list(seed_ranges))
+
+
+def solve(almanac: Almanac) -> int:
+    seed_ranges, mappings_per_stage = almanac
+
+    index = LocationIndex(mappings_per_stage)
+
+    return index.lowest_locations(seed_ranges)
+
+
+def main(filename: str = "input.txt"):
+    lowest_location = solve(parse(filename))
 
-    return
+    print("Lowest location number:", lowest_location)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+import asyncio
+from collections import OrderedDict
+import contextlib
+import io
+import random
+import unittest
+
+from seeds_part2 import (
+    LocationIndex,
+    Mapping,
+    PiecewiseMap,
+    Range,
+    compose_stages,
+    parse,
+    solve_by_stage,
+)
+
+
+def map_through_stages(stages: OrderedDict, value: int) -> int:
+    """Reference lookup, one stage and one mapping at a time."""
+    for mappings in stages.values():
+        for mapping in mappings:
+            if mapping.src_start <= value <= mapping.src_end:
+                value = mapping.parse(value)
+                break
+    return value
+
+
+def lowest_by_stage(stages: OrderedDict, seed_ranges) -> int:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return solve_by_stage((seed_ranges, stages))
+
+
+class Day05Part2TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.seed_ranges, self.stages = parse("input.txt")
+
+        # Mappings next to each other, one starting at 0, and an empty stage
+        self.small = OrderedDict()
+        self.small["a-to-b"] = [
+            Mapping(50, 0, 10),
+            Mapping(0, 10, 5),
+            Mapping(100, 15, 5),
+            Mapping(20, 30, 10),
+        ]
+        self.small["b-to-c"] = []
+        self.small["c-to-d"] = [Mapping(0, 5, 3), Mapping(200, 8, 50), Mapping(7, 0, 2)]
+
+    def test_from_mappings(self):
+        full_map = PiecewiseMap.from_mappings(self.small["a-to-b"])
+        self.assertEqual([0, 10, 15, 20, 30, 40], full_map.starts)
+        self.assertEqual([50, -10, 85, 0, -10, 0], full_map.offsets)
+
+        self.assertEqual(
+            ([0], [0]),
+            (empty := PiecewiseMap.from_mappings([])).starts
+            and (empty.starts, empty.offsets),
+        )
+
+    def test_compose_small(self):
+        full_map = compose_stages(self.small)
+        for value in range(150):
+            with self.subTest(value=value):
+                self.assertEqual(map_through_stages(self.small, value), full_map(value))
+
+        for start in range(0, 70, 3):
+            for length in (1, 2, 7, 30):
+                value_range = Range(start, length)
+                expected = lowest_by_stage(self.small, [Range(start, length)])
+                self.assertEqual(expected, full_map.get_lowest(value_range))
+
+    def test_compose_input(self):
+        full_map = compose_stages(self.stages)
+        rng = random.Random(5)
+
+        values = [r.start for r in self.seed_ranges] + [r.end for r in self.seed_ranges]
+        values += [s for start in full_map.starts for s in (start - 1, start)]
+        values += [rng.randrange(1 << 32) for _ in range(1000)]
+        for value in values:
+            if value >= 0:
+                self.assertEqual(
+                    map_through_stages(self.stages, value), full_map(value)
+                )
+
+        for seed_range in self.seed_ranges:
+            expected = lowest_by_stage(self.stages, [seed_range])
+            self.assertEqual(expected, full_map.get_lowest(seed_range))
+
+    def test_lowest_location(self):
+        rng = random.Random(15)
+        for stages in (self.small, self.stages):
+            index = LocationIndex(stages)
+            starts = index.map.starts
+            seed_ranges = []
+
+            # Inside a single segment
+            for i in rng.sample(range(len(starts) - 1), min(20, len(starts) - 1)):
+                start = rng.randrange(starts[i], starts[i + 1])
+                end = rng.randrange(start, starts[i + 1])
+                seed_ranges.append(Range(start, end=end))
+
+            # Spanning many segments, starting and ending anywhere
+            for _ in range(50):
+                first, last = sorted(rng.sample(range(len(starts)), 2))
+                start = starts[first] + rng.randrange(2)
+                end = starts[last] + rng.randrange(2)
+                seed_ranges.append(Range(start, end=end))
+            seed_ranges.append(Range(0, end=starts[-1] + 10))
+
+            for seed_range in seed_ranges:
+                with self.subTest(seed_range=seed_range):
+                    expected = lowest_by_stage(stages, [seed_range])
+                    self.assertEqual(expected, index.lowest_location(seed_range))
+
+            expected = lowest_by_stage(stages, seed_ranges)
+            lowest = asyncio.run(index.lowest_locations_async(seed_ranges))
+            self.assertEqual(expected, lowest)
+            self.assertEqual(expected, index.lowest_locations(seed_ranges))
+
+    def test_input(self):
+        index = LocationIndex(self.stages)
+        expected = lowest_by_stage(self.stages, self.seed_ranges)
+        self.assertEqual(expected, index.lowest_locations(self.seed_ranges))
+        self.assertEqual(26829166, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,14 @@
 import numpy as np
 import math
+from typing import Tuple
 
+# Largest time and distance for which the products of `get_numbers_of_options` fit
+# in int64
+MAX_VECTORIZED_TIME = math.isqrt(np.iinfo(np.int64).max)
+MAX_VECTORIZED_DISTANCE = np.iinfo(np.int64).max // 4
 
-def get_number_of_options(time: int, distance: int) -> int:
+
+def get_number_of_options_roots(time: int, distance: int) -> int:
     # The total traveled distance is:       `(tf - tb) * tb`
     # Because the final velocity equals the button press time, `tb`
     # Solving equating to the record time, quadratic formula:
@@ -12,15 +18,87 @@ def get_number_of_options(time: int, distance: int) -> int:
     return highest - lowest + 1
 
 
-def main():
-    with open("input.txt", "r") as fh:
+def get_number_of_options(time: int, distance: int) -> int:
+    """Count the button times that beat the record distance, in exact integers.
+
+    The traveled distance `(time - tb) * tb` is symmetric around `time / 2`, so with
+    the lowest winning `tb` the highest is `time - tb`. The integer square root
+    gives the lowest root, which is then corrected to the first `tb` that strictly
+    beats the record. This also works for integer roots (a tie is not a win) and for
+    numbers too big for floats.
+    """
+    discriminant = time * time - 4 * distance
+    if discriminant < 0:
+        return 0  # Record can't be reached at all
+
+    lowest = max((time - math.isqrt(discriminant)) // 2, 0)
+    while lowest > 0 and (lowest - 1) * (time - lowest + 1) > distance:
+        lowest -= 1
+    while (lowest <= time // 2) and lowest * (time - lowest) <= distance:
+        lowest += 1
+
+    return max(time - 2 * lowest + 1, 0)
+
+
+def get_numbers_of_options(times: np.ndarray, distances: np.ndarray) -> np.ndarray:
+    """Vectorized version of `get_number_of_options`, for arrays of races.
+
+    The discriminant and the products are computed in int64. The square root is
+    taken in floats, after which the lowest button time is corrected in integers.
+    Races with a time above `MAX_VECTORIZED_TIME` or a distance outside
+    `[0, MAX_VECTORIZED_DISTANCE]` would overflow and go through the exact scalar
+    path instead.
+    """
+    times = np.asarray(times, dtype=np.int64)
+    distances = np.asarray(distances, dtype=np.int64)
+
+    in_range = (
+        (times >= 0)
+        & (times <= MAX_VECTORIZED_TIME)
+        & (distances >= 0)
+        & (distances <= MAX_VECTORIZED_DISTANCE)
+    )
+    if not np.all(in_range):
+        counts = get_numbers_of_options(
+            np.where(in_range, times, 0), np.where(in_range, distances, 0)
+        )
+        for i in zip(*np.nonzero(~in_range)):
+            counts[i] = get_number_of_options(int(times[i]), int(distances[i]))
+        return counts
+
+    discriminant = times * times - 4 * distances
+    possible = discriminant >= 0
+    root = np.floor(np.sqrt(np.where(possible, discriminant, 0))).astype(np.int64)
+    lowest = np.maximum((times - root) // 2, 0)
+
+    def wins(tb: np.ndarray) -> np.ndarray:
+        return tb * (times - tb) > distances
+
+    while np.any(move := (lowest > 0) & wins(lowest - 1)):
+        lowest -= move
+    while np.any(move := (lowest <= times // 2) & ~wins(lowest)):
+        lowest += move
+
+    counts = np.maximum(times - 2 * lowest + 1, 0)
+    return np.where(possible, counts, 0)
+
+
+def parse(filename: str) -> Tuple[str, str]:
+    """Get the (stripped) strings of numbers for times and distances."""
+    with open(filename, "r") as fh:
         times_str = fh.readline()
         distances_str = fh.readline()
 
     times_str = times_str.partition(":")[2].strip()
-    times = [int(k) for k in times_str.split()]
-
     distances_str = distances_str.partition(":")[2].strip()
+
+    return times_str, distances_str
+
+
+def solve(sheet: Tuple[str, str]) -> Tuple[int, int]:
+    times_str, distances_str = sheet
+
+    times = [int(k) for k in times_str.split()]
     distances = [int(k) for k in distances_str.split()]
 
     # --- Part 1 ---
@@ -31,8 +109,6 @@ def main():
         number_of_options = get_number_of_options(time, distance)
         running_product *= number_of_options
 
-    print("Final product:", running_product)
-
     # --- Part 2 ---
 
     super_time = int(times_str.replace(" ", ""))
@@ -40,6 +116,14 @@ def main():
 
     number_of_options = get_number_of_options(super_time, super_distance)
 
+    return running_product, number_of_options
+
+
+def main(filename: str = "input.txt"):
+    running_product, number_of_options = solve(parse(filename))
+
+    print("Final product:", running_product)
+
     print("Number of super options:", number_of_options)
 
 
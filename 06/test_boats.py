@@ -0,0 +1,42 @@
+import unittest
+
+import numpy as np
+
+from boats import get_number_of_options, get_numbers_of_options
+
+
+def count_brute_force(time: int, distance: int) -> int:
+    return sum(tb * (time - tb) > distance for tb in range(time + 1))
+
+
+class Day06TestCase(unittest.TestCase):
+
+    def test_example(self):
+        times = np.array([7, 15, 30])
+        distances = np.array([9, 40, 200])
+        self.assertEqual([4, 8, 9], get_numbers_of_options(times, distances).tolist())
+        self.assertEqual(71503, get_number_of_options(71530, 940200))
+
+    def test_against_brute_force(self):
+        races = [(t, d) for t in range(40) for d in range(0, t * t // 4 + 3)]
+        times, distances = np.array(races).T
+        expected = [count_brute_force(t, d) for t, d in races]
+        self.assertEqual(expected, [get_number_of_options(t, d) for t, d in races])
+        self.assertEqual(expected, get_numbers_of_options(times, distances).tolist())
+
+    def test_tie(self):
+        # Pressing for 10 or 20 ms exactly ties the record of 200 mm
+        self.assertEqual(9, count_brute_force(30, 200))
+        self.assertEqual(9, get_number_of_options(30, 200))
+        self.assertEqual([9], get_numbers_of_options([30], [200]).tolist())
+
+    def test_out_of_range(self):
+        times = np.array([4_000_000_000, 30, 10])
+        distances = np.array([10**18, 200, 2**62])
+        counts = get_numbers_of_options(times, distances)
+        self.assertEqual([3464101615, 9, 0], counts.tolist())
+        self.assertEqual(3464101615, get_number_of_options(4_000_000_000, 10**18))
+
+
+if __name__ == "__main__":
+    unittest.main()
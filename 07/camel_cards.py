@@ -1,7 +1,10 @@
-from typing import List, Tuple, Dict
+from types import MappingProxyType
+from typing import List, Tuple, Dict, Mapping, NamedTuple, Optional, Sequence
 from collections import namedtuple
 from enum import IntEnum
 
+import numpy as np
+
 
 class HandType(IntEnum):
     """Possible hands to get, sorted by value."""
@@ -17,34 +20,205 @@ class HandType(IntEnum):
 
 CardOccurrence = namedtuple("CardOccurrence", ["card", "count"])
 
+CARDS = "23456789TJQKA"  # Encoded hands hold the index of each card in here
+WILD_CARD = "J"  # Joins the largest group of other cards when playing with jokers
 
-class Hand:
-    """Class for a set of 5 cards."""
+# Card ranks, jokers instead rank below "2" when playing with jokers
+RANKS = {c: r for r, c in enumerate(CARDS, start=2)}
+JOKER_RANK = 1
+
+RANK_BITS = 4  # Ranks go up to 14, so each card fits in a nibble
+TYPE_SHIFT = 5 * RANK_BITS
+
+
+class RuleSet(NamedTuple):
+    """Rules to rank hands by, these are never changed after creation."""
+
+    name: str
+    jokers: bool  # If True, `WILD_CARD` cards join the largest group of other cards
+    ranks: Mapping[str, int]  # Read-only rank by card, each must fit in `RANK_BITS`
+
+    def get_rank_table(self) -> np.ndarray:
+        """Get the rank of each card, in the order of `CARDS`."""
+        table = np.array([self.ranks[c] for c in CARDS], dtype=np.int64)
+        if np.any((table < 0) | (table >= 1 << RANK_BITS)):
+            raise ValueError(f"Ranks of `{self.name}` don't fit in {RANK_BITS} bits")
+        return table
+
+
+STANDARD = RuleSet("standard", False, MappingProxyType(RANKS))
+JOKER = RuleSet("joker", True, MappingProxyType({**RANKS, "J": JOKER_RANK}))
+
+
+def get_type_of_counts(counts: List[int]) -> HandType:
+    """Get the hand type from the card counts, sorted descending."""
+    if counts[0] == 5:
+        return HandType.FIVE_OF_A_KIND
+    if counts[0] == 4:
+        return HandType.FOUR_OF_A_KIND
+    if counts[0] == 3:
+        return HandType.FULL_HOUSE if counts[1] == 2 else HandType.THREE_OF_A_KIND
+    if counts[0] == 2:
+        return HandType.TWO_PAIR if counts[1] == 2 else HandType.ONE_PAIR
+    return HandType.HIGH_CARD
+
+
+def get_partitions(total: int, largest: int = 5) -> List[Tuple[int, ...]]:
+    """Get all ways to write `total` as a sum of counts, sorted descending."""
+    if total == 0:
+        return [()]
+
+    return [
+        (first,) + rest
+        for first in range(min(total, largest), 0, -1)
+        for rest in get_partitions(total - first, first)
+    ]
+
+
+# Hand type by the sorted counts of the regular cards and the number of jokers
+TYPES_BY_SIGNATURE: Dict[Tuple[Tuple[int, ...], int], HandType] = {}
+
+# The same in an array, indexed by the two largest counts and the number of jokers
+TYPE_TABLE = np.full((6, 6, 6), -1, dtype=np.int8)
+
+for _jokers in range(6):
+    for _signature in get_partitions(5 - _jokers):
+        _counts = list(_signature) or [0]
+        _counts[0] += _jokers  # Jokers join the largest group
+        _type = get_type_of_counts(_counts + [0])
+        TYPES_BY_SIGNATURE[(_signature, _jokers)] = _type
+        TYPE_TABLE[_counts[0] - _jokers, (_counts + [0])[1], _jokers] = _type
+
+
+def classify(counts: Dict[str, int], jokers: bool = False) -> HandType:
+    """Get the hand type from the number of each card in a hand."""
+    if jokers and WILD_CARD in counts:
+        joker_count = counts[WILD_CARD]
+        signature = tuple(
+            sorted((v for c, v in counts.items() if c != WILD_CARD), reverse=True)
+        )
+    else:
+        joker_count = 0
+        signature = tuple(sorted(counts.values(), reverse=True))
+
+    return TYPES_BY_SIGNATURE[(signature, joker_count)]
+
+
+def get_sort_keys(
+    txt: str, rule_sets: Sequence[RuleSet] = (STANDARD, JOKER)
+) -> Tuple[int, ...]:
+    """Get the integer sort key of a hand for each set of rules.
+
+    A key holds the hand type in the high bits, followed by the rank of each card
+    in a nibble, so sorting by key sorts the hands by strength. The cards are
+    counted only once for all rule sets.
+    """
+    counts: Dict[str, int] = {}
+    for c in txt:
+        counts[c] = counts.get(c, 0) + 1
+
+    keys = []
+    for rules in rule_sets:
+        key = classify(counts, rules.jokers)
+        for c in txt:
+            rank = rules.ranks[c]
+            if not 0 <= rank < 1 << RANK_BITS:
+                raise ValueError(f"Rank of `{c}` doesn't fit in {RANK_BITS} bits")
+            key = (key << RANK_BITS) | rank
+        keys.append(key)
+
+    return tuple(keys)
+
+
+def encode_hands(hands: List[str]) -> np.ndarray:
+    """Get an `(n, 5)` array with the index in `CARDS` of each card in the hands."""
+    for txt in hands:
+        if len(txt) != 5:
+            raise ValueError(f"Passed string `{txt}` is not 5 cards!")
+
+    unknown = np.iinfo(np.uint8).max
+    lookup = np.full(256, unknown, dtype=np.uint8)
+    for i, c in enumerate(CARDS):
+        lookup[ord(c)] = i
+
+    data = np.frombuffer("".join(hands).encode("ascii"), dtype=np.uint8)
+    encoded = lookup[data].reshape(-1, 5)
 
-    JOKERS = False
+    invalid = np.nonzero(np.any(encoded == unknown, axis=1))[0]
+    if len(invalid):
+        raise ValueError(f"Passed string `{hands[invalid[0]]}` has unknown cards!")
 
-    CARDS = {
-        "T": 10,
-        "J": 11,
-        "Q": 12,
-        "K": 13,
-        "A": 14,
-    }
+    return encoded
 
-    def __init__(self, txt: str):
+
+def count_cards(hands: np.ndarray) -> np.ndarray:
+    """Get an `(n, len(CARDS))` array with the number of each card in encoded hands."""
+    cards = np.arange(len(CARDS), dtype=hands.dtype)
+    return (hands[:, :, np.newaxis] == cards).sum(axis=1)
+
+
+def classify_counts(counts: np.ndarray, jokers: bool = False) -> np.ndarray:
+    """Get the hand types from the card counts of `count_cards`."""
+    joker_counts = np.zeros(len(counts), dtype=np.intp)
+    if jokers:
+        joker_counts = counts[:, CARDS.index(WILD_CARD)]
+        counts = counts.copy()
+        counts[:, CARDS.index(WILD_CARD)] = 0
+
+    counts = np.sort(counts, axis=1)
+    return TYPE_TABLE[counts[:, -1], counts[:, -2], joker_counts]
+
+
+def classify_hands(hands: np.ndarray, jokers: bool = False) -> np.ndarray:
+    """Get the hand type of each row in an array of encoded hands, at once."""
+    return classify_counts(count_cards(hands), jokers)
+
+
+def get_sort_keys_of_hands(
+    hands: np.ndarray, rules: RuleSet, counts: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Get the sort keys (see `get_sort_keys`) of an array of encoded hands.
+
+    :param counts: Result of `count_cards`, if already known
+    """
+    if counts is None:
+        counts = count_cards(hands)
+
+    ranks = rules.get_rank_table()[hands]
+    shifts = RANK_BITS * np.arange(4, -1, -1, dtype=np.int64)
+    keys = (ranks << shifts).sum(axis=1)
+    types = classify_counts(counts, rules.jokers).astype(np.int64)
+    return keys | (types << TYPE_SHIFT)
+
+
+def get_total_winnings(keys: np.ndarray, bids: np.ndarray) -> int:
+    """Get the total winnings of hands by their sort keys, with `np.argsort`."""
+    order = np.argsort(keys, kind="stable")
+    ranks = np.arange(1, len(order) + 1, dtype=np.int64)
+    return int((bids[order] * ranks).sum())
+
+
+class Hand:
+    """Class for a set of 5 cards."""
+
+    def __init__(self, txt: str, rules: RuleSet = STANDARD):
         """
 
         :param txt: Five characters for this hand.
+        :param rules: Rules for `cards`, `hand_type` and `key`
         """
         if len(txt) != 5:
             raise ValueError(f"Passed string `{txt}` is not 5 cards!")
 
         self.cards_str = txt
+        self.rules = rules
 
         # Cards in hand, in original order
-        self.cards = [self.CARDS[c] for c in txt]
+        self.cards = [rules.ranks[c] for c in txt]
 
-        self.hand_type = self.get_hand_type()
+        self.key = get_sort_keys(txt, [rules])[0]
+
+        self.hand_type = HandType(self.key >> TYPE_SHIFT)
 
         return
 
@@ -55,14 +229,18 @@ class Hand:
         return f"<Hand instance `{self.__str__()}`>"
 
     def get_hand_type(self) -> HandType:
-        """Find hand set for given hand."""
+        """Find hand set for given hand, by counting the cards.
+
+        `hand_type` comes from the sort key instead, this is kept as reference.
+        """
 
         card_counts = self.get_card_occurrences(self.cards)
 
-        if self.JOKERS:
+        if self.rules.jokers:
+            wild_card = self.rules.ranks[WILD_CARD]
             i = 0
             while i < len(card_counts):
-                if card_counts[i].card == 1 and len(card_counts) > 1:  # = "J"
+                if card_counts[i].card == wild_card and len(card_counts) > 1:
                     # For a joker, add its count to the highest set instead:
                     idx = 0 if i > 0 else 1
                     new_count = card_counts[idx].count + card_counts[i].count
@@ -119,52 +297,52 @@ class Hand:
 
         :return: True if `self` is less than `other`
         """
-        if self.hand_type < other.hand_type:
-            return True
-        if self.hand_type > other.hand_type:
-            return False
+        if self.key == other.key:
+            raise ValueError(f"Cards `{self}` and `{other}` are the same!")
 
-        # Hands are of equal type...
+        return self.key < other.key
 
-        for card_self, card_other in zip(self.cards, other.cards):
-            if card_self < card_other:
-                return True
-            if card_self > card_other:
-                return False
 
-        raise ValueError(f"Cards `{self}` and `{other}` are the same!")
+Game = Tuple[np.ndarray, np.ndarray]  # Encoded hands and their bids
 
 
-for _i in range(2, 10):
-    Hand.CARDS[str(_i)] = _i
+def parse(filename: str) -> Game:
+    with open(filename, "r") as fh:
+        words = fh.read().split()
 
+    hands = encode_hands(words[0::2])
+    bids = np.array([int(bid) for bid in words[1::2]], dtype=np.int64)
 
-def main():
-    Hand.JOKERS = True
+    return hands, bids
 
-    if Hand.JOKERS:
-        Hand.CARDS["J"] = 1  # Lowest instead!
 
-    hands_and_bids: List[Tuple[Hand, int]] = []
+def get_scores(
+    hands: np.ndarray,
+    bids: np.ndarray,
+    rule_sets: Sequence[RuleSet] = (STANDARD, JOKER),
+) -> List[int]:
+    """Get the total winnings of the same (encoded) hands for each set of rules.
 
-    with open("input.txt", "r") as fh:
-        while (line := fh.readline()) != "":
-            hand_str, _, bid_str = line.strip().partition(" ")
+    The cards are counted once for all rule sets. Nothing shared is modified, so
+    this can run in multiple threads at once.
+    """
+    counts = count_cards(hands)
+    return [
+        get_total_winnings(get_sort_keys_of_hands(hands, rules, counts), bids)
+        for rules in rule_sets
+    ]
 
-            hands_and_bids.append((Hand(hand_str), int(bid_str)))
 
-    # Sort list of tuples by hand (weakest first)
-    hands_and_bids_sorted = [
-        (hand, bid) for hand, bid in sorted(hands_and_bids, key=lambda x: x[0])
-    ]
+def solve(game: Game) -> Tuple[int, int]:
+    score, joker_score = get_scores(*game, (STANDARD, JOKER))
+    return score, joker_score
 
-    score = 0
 
-    for i, hand_and_bid in enumerate(hands_and_bids_sorted):
-        rank = i + 1
-        score += rank * hand_and_bid[1]
+def main(filename: str = "input.txt"):
+    score, joker_score = solve(parse(filename))
 
     print("Final score is:", score)
+    print("Final score with jokers is:", joker_score)
 
 
 if __name__ == "__main__":
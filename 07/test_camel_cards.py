@@ -0,0 +1,112 @@
+import os
+import random
+import tempfile
+from types import MappingProxyType
+import unittest
+
+import numpy as np
+
+from camel_cards import (
+    Hand,
+    HandType,
+    JOKER,
+    RuleSet,
+    STANDARD,
+    classify_hands,
+    encode_hands,
+    get_scores,
+    get_sort_keys,
+    parse,
+)
+
+
+class Day07TestCase(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.hands = ["32T3K", "T55J5", "KK677", "KTJJT", "QQQJA", "JJJJJ", "J2345"]
+        self.hands += ["".join(rng.choices("23456789TJQKA", k=5)) for _ in range(2000)]
+        self.hands += ["".join(rng.choices("JJJ2Q", k=5)) for _ in range(500)]
+
+    def get_types_of_class(self, jokers: bool):
+        rules = JOKER if jokers else STANDARD
+        return [Hand(txt, rules).get_hand_type() for txt in self.hands]
+
+    def test_classify_hands(self):
+        encoded = encode_hands(self.hands)
+        for jokers in (False, True):
+            with self.subTest(jokers=jokers):
+                expected = self.get_types_of_class(jokers)
+                self.assertEqual(expected, classify_hands(encoded, jokers).tolist())
+
+    def test_sort_keys(self):
+        standard = self.get_types_of_class(False)
+        joker = self.get_types_of_class(True)
+        for txt, standard_type, joker_type in zip(self.hands, standard, joker):
+            standard_key, joker_key = get_sort_keys(txt)
+            self.assertEqual(standard_type, standard_key >> 20)
+            self.assertEqual(joker_type, joker_key >> 20)
+
+    def test_jokers(self):
+        encoded = encode_hands(["JJJJJ", "KTJJT", "2345J"])
+        self.assertEqual(
+            [
+                HandType.FIVE_OF_A_KIND,
+                HandType.FOUR_OF_A_KIND,
+                HandType.ONE_PAIR,
+            ],
+            classify_hands(encoded, jokers=True).tolist(),
+        )
+
+    def test_scores(self):
+        hands = encode_hands(["32T3K", "T55J5", "KK677", "KTJJT", "QQQJA"])
+        bids = np.array([765, 684, 28, 220, 483])
+        self.assertEqual([6440, 5905], get_scores(hands, bids))
+        self.assertEqual([5905], get_scores(hands, bids, [JOKER]))
+        self.assertEqual([0, 0], get_scores(encode_hands([]), np.array([])))
+
+    def test_custom_rules(self):
+        # Aces low and jokers at 0, so nothing may fall back to the built-in ranks
+        ranks = {c: r for r, c in enumerate("A23456789TJQK", start=1)}
+        rules = RuleSet("custom", True, MappingProxyType({**ranks, "J": 0}))
+
+        hands = self.hands[:300]
+        bids = np.arange(1, len(hands) + 1)
+        by_hand = sorted(zip(hands, bids.tolist()), key=lambda x: Hand(x[0], rules))
+        expected = sum(rank * bid for rank, (_, bid) in enumerate(by_hand, start=1))
+
+        self.assertEqual([expected], get_scores(encode_hands(hands), bids, [rules]))
+        for txt in hands:
+            hand = Hand(txt, rules)
+            self.assertEqual(hand.get_hand_type(), hand.hand_type)
+            self.assertEqual(rules.ranks[txt[-1]], hand.key & 0xF)
+
+        with self.assertRaises(ValueError):
+            RuleSet(
+                "wide", False, MappingProxyType({**ranks, "K": 16})
+            ).get_rank_table()
+
+    def test_hand_type(self):
+        for rules in (STANDARD, JOKER):
+            for txt in self.hands[:200]:
+                hand = Hand(txt, rules)
+                self.assertEqual(hand.get_hand_type(), hand.hand_type)
+
+    def test_malformed_hands(self):
+        with self.assertRaisesRegex(ValueError, "not 5 cards"):
+            encode_hands(["32T3", "T55J55"])
+        with self.assertRaisesRegex(ValueError, "`T5XJ5`"):
+            encode_hands(["32T3K", "T5XJ5"])
+        with self.assertRaises(ValueError):
+            encode_hands(["32T3\u00c9"])
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "input.txt")
+            with open(filename, "w") as fh:
+                fh.write("32T3 765\nT55J55 684\n")
+            with self.assertRaises(ValueError):
+                parse(filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
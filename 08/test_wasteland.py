@@ -0,0 +1,127 @@
+import unittest
+
+from wasteland import CompiledNetwork, Network, Node, combine_residues
+
+
+def make_network(directions: str, nodes: dict) -> Network:
+    network = Network(directions)
+    for name, (left, right) in nodes.items():
+        Node(network, name, left, right)
+    return network
+
+
+def walk(network: Network, start: str, steps: int) -> str:
+    """Reference walk, one step at a time."""
+    name = start
+    for i in range(steps):
+        direction = network.directions_str[i % len(network.directions_str)]
+        node = network.nodes[name]
+        name = node.left_name if direction == "L" else node.right_name
+    return name
+
+
+# Example of part 2 from the puzzle
+EXAMPLE_GHOSTS = {
+    "11A": ("11B", "XXX"),
+    "11B": ("XXX", "11Z"),
+    "11Z": ("11B", "XXX"),
+    "22A": ("22B", "XXX"),
+    "22B": ("22C", "22C"),
+    "22C": ("22Z", "22Z"),
+    "22Z": ("22B", "22B"),
+    "XXX": ("XXX", "XXX"),
+}
+
+
+class Day08TestCase(unittest.TestCase):
+
+    def setUp(self):
+        # Only going left: ghost 1 hits its goal at steps 2, 5, 8, ... (2 mod 3) and
+        # ghost 2 at steps 1, 3, 5, ... (odd), neither on a multiple of its period
+        self.shifted = make_network(
+            "L",
+            {
+                "11A": ("11B", "11B"),
+                "11B": ("11Z", "11Z"),
+                "11Z": ("11C", "11C"),
+                "11C": ("11B", "11B"),
+                "22A": ("22Z", "22Z"),
+                "22Z": ("22B", "22B"),
+                "22B": ("22Z", "22Z"),
+            },
+        )
+
+        # Ghost 3 hits at steps 1, 4, 7, ... (1 mod 3), never together with ghost 1
+        self.apart = make_network(
+            "L",
+            {
+                "11A": ("11B", "11B"),
+                "11B": ("11Z", "11Z"),
+                "11Z": ("11C", "11C"),
+                "11C": ("11B", "11B"),
+                "33A": ("33Z", "33Z"),
+                "33Z": ("33B", "33B"),
+                "33B": ("33C", "33C"),
+                "33C": ("33Z", "33Z"),
+            },
+        )
+
+    def test_combine_residues(self):
+        self.assertEqual(5, combine_residues(2, 3, 1, 2))
+        self.assertEqual(7, combine_residues(1, 6, 3, 4))  # Not co-prime
+        self.assertIsNone(combine_residues(0, 6, 1, 4))
+
+    def test_find_cycle(self):
+        network = CompiledNetwork(self.shifted)
+        cycle = network.find_cycle(network.names.index("11A"))
+        self.assertEqual((1, 3), (cycle.tail, cycle.period))
+        self.assertEqual([], cycle.tail_hits)
+        self.assertEqual([2], cycle.cycle_hits)
+        self.assertTrue(cycle.is_goal(8))
+        self.assertFalse(cycle.is_goal(9))
+
+    def test_shifted_goals(self):
+        # The lcm of the periods would give 6
+        self.assertEqual(5, CompiledNetwork(self.shifted).get_steps_to_goals())
+
+    def test_never_together(self):
+        self.assertIsNone(CompiledNetwork(self.apart).get_steps_to_goals())
+
+    def test_example(self):
+        network = CompiledNetwork(make_network("LR", EXAMPLE_GHOSTS))
+        self.assertEqual(6, network.get_steps_to_goals())
+
+    def test_position_after(self):
+        network = make_network("LR", EXAMPLE_GHOSTS)
+        compiled = CompiledNetwork(network)
+        for start in ("11A", "22A", "22Z"):
+            for steps in range(40):
+                with self.subTest(start=start, steps=steps):
+                    expected = walk(network, start, steps)
+                    self.assertEqual(expected, compiled.position_after(start, steps))
+
+        # Far beyond the jump tables, the cycle of 22B, 22C, 22Z starts at step 1
+        self.assertEqual("22Z", compiled.position_after("22A", 3 * 10**18))
+        self.assertEqual("11B", compiled.position_after("11A", 10**18 + 1))
+
+    def test_first_goal_hit(self):
+        compiled = CompiledNetwork(make_network("LR", EXAMPLE_GHOSTS))
+        self.assertEqual(2, compiled.first_goal_hit("11A"))
+        self.assertEqual(3, compiled.first_goal_hit("22A"))
+        self.assertEqual(2, compiled.first_goal_hit("22A", "22C"))
+        self.assertEqual(1, compiled.first_goal_hit("XXX", "XXX"))
+        self.assertIsNone(compiled.first_goal_hit("22A", "11Z"))
+        self.assertIsNone(compiled.first_goal_hit("XXX"))
+
+        compiled = CompiledNetwork(self.shifted)
+        self.assertEqual(2, compiled.first_goal_hit("11A"))
+        self.assertEqual(1, compiled.first_goal_hit("22A"))
+
+    def test_period_and_offset(self):
+        compiled = CompiledNetwork(self.shifted)
+        self.assertEqual((3, [2]), compiled.get_period_and_offset("11A"))
+        self.assertEqual((2, [1]), compiled.get_period_and_offset("22A"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,15 @@
-from typing import Optional, Dict, List
-from math import lcm
+from typing import Optional, Dict, List, NamedTuple, Tuple
+from math import gcd, lcm
+
+import numpy as np
 
 
 class Node:
     """Container for a node, contain a left and right sub-node."""
 
-    ALL: Dict[str, "Node"] = {}  # "name": "node"
-
     def __init__(
         self,
+        network: "Network",
         name: str,
         left_name: Optional[str] = None,
         right_name: Optional[str] = None,
@@ -16,37 +17,48 @@ class Node:
         if name is None or len(name) != 3:
             raise ValueError("Name must be valid")
 
-        if name in self.ALL:
+        if name in network.nodes:
             raise ValueError(f"Node `{name}` already registered!")
 
+        self.network = network
         self.name = name
         self.left_name = left_name
         self.right_name = right_name
 
-        self.ALL[self.name] = self
+        network.nodes[self.name] = self
 
     @property
     def left(self) -> "Node":
-        return self.get_or_make(self.left_name)
+        return self.network.get_or_make(self.left_name)
 
     @property
     def right(self) -> "Node":
-        return self.get_or_make(self.right_name)
+        return self.network.get_or_make(self.right_name)
 
     def __repr__(self):
         return f"Node ({self.name})"
 
-    @classmethod
-    def get_or_make(cls, name: str) -> "Node":
-        if name in cls.ALL:
-            return cls.ALL[name]
 
-        return Node(name)  # Registration is done inside constructor
+class Network:
+    """Container for the directions and the nodes of a single map."""
+
+    def __init__(self, directions_str: str = ""):
+        self.directions_str = directions_str
+        self.nodes: Dict[str, Node] = {}  # "name": "node"
+
+    def __repr__(self):
+        return f"<Network of {len(self.nodes)} nodes>"
 
+    def get_or_make(self, name: str) -> Node:
+        if name in self.nodes:
+            return self.nodes[name]
 
-def main():
-    with open("input.txt", "r") as fh:
-        directions_str = fh.readline().strip()
+        return Node(self, name)  # Registration is done inside constructor
+
+
+def parse(filename: str) -> Network:
+    with open(filename, "r") as fh:
+        network = Network(fh.readline().strip())
         fh.readline()
 
         while (line := fh.readline()) != "":
@@ -60,10 +72,15 @@ def main():
             )
 
             Node(
-                node_name, left_name, right_name
+                network, node_name, left_name, right_name
             )  # No need to save reference to object
 
-    current_node_names = [name for name in Node.ALL.keys() if name.endswith("A")]
+    return network
+
+
+def solve_by_walking(network: Network) -> Optional[int]:
+    directions_str = network.directions_str
+    current_node_names = [name for name in network.nodes.keys() if name.endswith("A")]
     directions_index = 0
     directions_len = len(directions_str)
     steps = 0
@@ -77,9 +94,9 @@ def main():
     while any(n is None for n in node_cycles):
         for i, current_node_name in enumerate(current_node_names):
             if directions_str[directions_index] == "L":
-                current_node_names[i] = Node.ALL[current_node_name].left_name
+                current_node_names[i] = network.nodes[current_node_name].left_name
             else:
-                current_node_names[i] = Node.ALL[current_node_name].right_name
+                current_node_names[i] = network.nodes[current_node_name].right_name
 
             if current_node_names[i].endswith("Z"):
                 if node_cycles[i] is None:
@@ -89,7 +106,7 @@ def main():
 
         if steps > 10000000:
             print(f"Aborted after {steps} steps...")
-            return
+            return None
             # raise RuntimeError(f"Steps exceeded {steps}, something is probably wrong")
 
         steps += 1
@@ -99,8 +116,257 @@ def main():
 
     print(f"Found pattern after steps: {steps}")
 
-    expected_steps = lcm(*node_cycles)
-    print(f"Expect to get there after {expected_steps} steps")
+    return lcm(*node_cycles)
+
+
+def combine_residues(a: int, m: int, b: int, n: int) -> Optional[int]:
+    """Get `x` (modulo `lcm(m, n)`) with `x = a (mod m)` and `x = b (mod n)`.
+
+    The moduli don't need to be co-prime, returns `None` when there is no solution.
+    """
+    g = gcd(m, n)
+    if (b - a) % g != 0:
+        return None
+
+    k = ((b - a) // g * pow(m // g, -1, n // g)) % (n // g)
+    return (a + m * k) % (m // g * n)
+
+
+class Cycle(NamedTuple):
+    """Walk of a single ghost: a tail of steps followed by an endless cycle."""
+
+    tail: int  # Steps before entering the cycle
+    period: int  # Steps in the cycle
+    tail_hits: List[int]  # Steps in the tail that end on a goal
+    cycle_hits: List[int]  # Steps in the first round of the cycle that end on a goal
+
+    def is_goal(self, steps: int) -> bool:
+        """Return True if the walk is on a goal after a number of steps."""
+        if steps < self.tail:
+            return steps in self.tail_hits
+
+        steps = self.tail + (steps - self.tail) % self.period
+        return steps in self.cycle_hits
+
+    def get_hits_below(self, limit: int) -> List[int]:
+        """Get all steps before `limit` that end on a goal."""
+        hits = [t for t in self.tail_hits if t < limit]
+        for first in self.cycle_hits:
+            hits += range(first, limit, self.period)
+        return sorted(hits)
+
+
+class CompiledNetwork:
+    """Network turned into integer successor arrays, to walk without names.
+
+    Nodes are numbered in order of the original network. The direction index is
+    part of the state of a walk, since the same node can be reached at different
+    points in the directions.
+
+    For queries, walks always start at the first direction. The node after every
+    number of steps within one pass over the directions is kept in a table. The
+    last row of it is the "macro step" of a full pass, which is combined with
+    itself into jump tables of 1, 2, 4, ... passes (binary lifting). Any position
+    or first goal is then found in a number of jumps logarithmic in the steps.
+    """
+
+    def __init__(self, network: Network):
+        self.names = list(network.nodes.keys())
+        self.index = {name: i for i, name in enumerate(self.names)}
+        index = self.index
+
+        nodes = network.nodes.values()
+        self.left = np.array([index[n.left_name] for n in nodes], dtype=np.int32)
+        self.right = np.array([index[n.right_name] for n in nodes], dtype=np.int32)
+        self.goals = np.array([name.endswith("Z") for name in self.names])
+        self.starts = [i for i, name in enumerate(self.names) if name.endswith("A")]
+
+        self.directions = np.array(
+            [c == "R" for c in network.directions_str], dtype=np.int8
+        )
+
+        # `positions[r, node]` is the node after `r` steps of a pass, from `node`
+        successors = np.stack((self.left, self.right))
+        self.positions = np.empty((len(self.directions) + 1, len(self.names)), np.int32)
+        self.positions[0] = np.arange(len(self.names))
+        for r, direction in enumerate(self.directions):
+            self.positions[r + 1] = successors[direction][self.positions[r]]
+
+        # `jumps[j][node]` is the node after `2**j` full passes, from `node`
+        self.jumps = [self.positions[-1]]
+        while (1 << len(self.jumps)) <= len(self.names):
+            self.jumps.append(self.jumps[-1][self.jumps[-1]])
+
+        self._goal_tables: Dict[Optional[int], Tuple[np.ndarray, List[np.ndarray]]] = {}
+
+    def get_node(self, name: str) -> int:
+        if name not in self.index:
+            raise KeyError(f"Node `{name}` is not in the network")
+        return self.index[name]
+
+    def get_jump(self, j: int) -> np.ndarray:
+        """Get the table of `2**j` passes, extending the tables when needed."""
+        while len(self.jumps) <= j:
+            self.jumps.append(self.jumps[-1][self.jumps[-1]])
+        return self.jumps[j]
+
+    def position_after(self, start: str, steps: int) -> str:
+        """Get the node reached after a number of steps from a start node."""
+        if steps < 0:
+            raise ValueError("Number of steps cannot be negative")
+
+        passes, rest = divmod(steps, len(self.directions))
+        node = self.get_node(start)
+        for j in range(passes.bit_length()):
+            if (passes >> j) & 1:
+                node = self.get_jump(j)[node]
+
+        return self.names[self.positions[rest][node]]
+
+    def get_goal_tables(
+        self, goal: Optional[int] = None
+    ) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """Get the tables to find the first goal, either a single node or all goals.
+
+        The first array is the first step of a pass that ends on a goal, from each
+        node, or -1 if there is none. The list holds for each jump size whether a
+        goal is hit somewhere during those passes.
+        """
+        if goal not in self._goal_tables:
+            mask = self.goals
+            if goal is not None:
+                mask = np.zeros(len(self.names), dtype=bool)
+                mask[goal] = True
+
+            on_goal = mask[self.positions[1:]]  # Shape (steps of pass, nodes)
+            first = np.where(on_goal.any(axis=0), on_goal.argmax(axis=0) + 1, -1)
+
+            hits = [first >= 0]
+            for jump in self.jumps[:-1]:
+                hits.append(hits[-1] | hits[-1][jump])
+
+            self._goal_tables[goal] = (first, hits)
+
+        return self._goal_tables[goal]
+
+    def first_goal_hit(self, start: str, goal: Optional[str] = None) -> Optional[int]:
+        """Get the first step (at least 1) at which a walk ends on a goal.
+
+        :param start: Name of the start node
+        :param goal: Name of the target node, or `None` for any node ending in "Z"
+        :return: Number of steps, or `None` if the goal is never reached
+        """
+        first, hits = self.get_goal_tables(
+            None if goal is None else self.get_node(goal)
+        )
+        node = self.get_node(start)
+        passes = 0
+
+        # Jump over as many passes as possible without hitting a goal:
+        for j in reversed(range(len(hits))):
+            if not hits[j][node]:
+                node = self.jumps[j][node]
+                passes += 1 << j
+
+        if first[node] < 0:
+            return None  # Tables cover more passes than there are nodes
+
+        return passes * len(self.directions) + int(first[node])
+
+    def get_period_and_offset(self, start: str) -> Tuple[int, List[int]]:
+        """Get the cycle length of a walk and the steps in it that end on a goal."""
+        cycle = self.find_cycle(self.get_node(start))
+        return cycle.period, cycle.cycle_hits
+
+    def find_cycle(self, start: int) -> Cycle:
+        """Walk from a node until the state repeats, with Brent's algorithm."""
+        successors = (self.left.tolist(), self.right.tolist())
+        directions = self.directions.tolist()
+        length = len(directions)
+
+        def step(state: Tuple[int, int]) -> Tuple[int, int]:
+            node, i = state
+            return successors[directions[i]][node], (i + 1) % length
+
+        # Find the cycle length, by moving the tortoise ahead in powers of two:
+        power = period = 1
+        tortoise = (start, 0)
+        hare = step(tortoise)
+        while tortoise != hare:
+            if power == period:
+                tortoise = hare
+                power *= 2
+                period = 0
+            hare = step(hare)
+            period += 1
+
+        # Find the start of the cycle, with the hare `period` steps ahead:
+        tortoise = hare = (start, 0)
+        for _ in range(period):
+            hare = step(hare)
+        tail = 0
+        while tortoise != hare:
+            tortoise, hare = step(tortoise), step(hare)
+            tail += 1
+
+        goals = self.goals.tolist()
+        hits = []
+        state = (start, 0)
+        for steps in range(tail + period):
+            if goals[state[0]]:
+                hits.append(steps)
+            state = step(state)
+
+        tail_hits = [t for t in hits if t < tail]
+        cycle_hits = [t for t in hits if t >= tail]
+        return Cycle(tail, period, tail_hits, cycle_hits)
+
+    def get_steps_to_goals(self, starts: Optional[List[int]] = None) -> Optional[int]:
+        """Get the first step (at least 1) at which all walks are on a goal.
+
+        Before all walks are inside their cycle the steps are checked one by one,
+        after that the cycles are combined with the Chinese remainder theorem. When
+        every goal is hit at a multiple of its cycle length this is the `lcm` of the
+        cycles, but shifted goals work too.
+        """
+        if starts is None:
+            starts = self.starts
+
+        cycles = [self.find_cycle(start) for start in starts]
+        if not cycles:
+            return None
+
+        tail_end = max(max(c.tail for c in cycles), 1)
+
+        for steps in cycles[0].get_hits_below(tail_end):
+            if steps >= 1 and all(c.is_goal(steps) for c in cycles):
+                return steps
+
+        residues, modulus = {0}, 1
+        for cycle in cycles:
+            residues = {
+                x
+                for a in residues
+                for b in cycle.cycle_hits
+                if (x := combine_residues(a, modulus, b, cycle.period)) is not None
+            }
+            modulus = lcm(modulus, cycle.period)
+
+        if not residues:
+            return None  # The walks are never on a goal at the same time
+
+        return min(tail_end + (r - tail_end) % modulus for r in residues)
+
+
+def solve(network: Network) -> Optional[int]:
+    return CompiledNetwork(network).get_steps_to_goals()
+
+
+def main(filename: str = "input.txt"):
+    expected_steps = solve(parse(filename))
+
+    if expected_steps is not None:
+        print(f"Expect to get there after {expected_steps} steps")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,11 @@
-from typing import List
+from collections import defaultdict
+from functools import lru_cache
+from math import comb
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+INT64_LIMIT = 1 << 63
 
 
 def get_next_in_sequence(initial_sequence: List[int]) -> int:
@@ -34,16 +41,173 @@ def get_next_in_sequence(initial_sequence: List[int]) -> int:
     return sequences_list[0][-1]  # Last new value
 
 
-def main():
+@lru_cache(maxsize=None)
+def get_coefficients(length: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Get the weights of each value, to find the next and the previous value.
+
+    The difference rows of `n` values always end in a zero row of level `n`, so
+    the values are on a polynomial and the next one is a fixed binomial sum:
+    `x[n] = sum((-1)^(n-1-i) C(n, i) x[i])`. Similarly before the first value:
+    `x[-1] = sum((-1)^i C(n, i+1) x[i])`.
+    """
+    next_weights = tuple(
+        (-1) ** (length - 1 - i) * comb(length, i) for i in range(length)
+    )
+    previous_weights = tuple((-1) ** i * comb(length, i + 1) for i in range(length))
+    return next_weights, previous_weights
+
+
+def extrapolate_rows(rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the next and previous value of each row in a 2D array of sequences.
+
+    Rows are switched to an array of Python ints when the result could overflow.
+    """
+    next_weights, previous_weights = get_coefficients(rows.shape[1])
+
+    if rows.dtype != object:
+        largest = int(np.abs(rows).max()) if rows.size else 0
+        weights = max(sum(map(abs, next_weights)), sum(map(abs, previous_weights)))
+        if max(largest, 1) * weights >= INT64_LIMIT:
+            rows = rows.astype(object)
+
+    next_values = rows @ np.array(next_weights, dtype=rows.dtype)
+    previous_values = rows @ np.array(previous_weights, dtype=rows.dtype)
+    return next_values, previous_values
+
+
+def extrapolate(sequences: List[List[int]]) -> Tuple[List[int], List[int]]:
+    """Get the next and previous value of every sequence.
+
+    Sequences are grouped by length, so each group is a single 2D array.
+    """
+    next_values = [0] * len(sequences)
+    previous_values = [0] * len(sequences)
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for i, sequence in enumerate(sequences):
+        groups[len(sequence)].append(i)
+
+    for length, indices in groups.items():
+        group = [sequences[i] for i in indices]
+        try:
+            rows = np.array(group, dtype=np.int64)
+        except OverflowError:
+            rows = np.array(group, dtype=object)
+        rows = rows.reshape(len(indices), length)
+
+        group_next, group_previous = extrapolate_rows(rows)
+        for i, next_value, previous_value in zip(
+            indices, group_next.tolist(), group_previous.tolist()
+        ):
+            next_values[i] = next_value
+            previous_values[i] = previous_value
+
+    return next_values, previous_values
+
+
+class OnlineExtrapolator:
+    """Predicts the next value of a sequence that arrives one value at a time.
+
+    Only the last value of each difference row is kept. A new value updates those
+    from the top row down, and the prediction is their sum.
+    """
+
+    def __init__(self, max_depth: Optional[int] = None):
+        """
+
+        :param max_depth: Number of difference rows to keep, deeper rows are assumed
+            to be zero. `None` to keep as many rows as there are values.
+        """
+        self.max_depth = max_depth
+        self.tails: List[int] = []  # Last value of each difference row
+        self.count = 0
+
+    def add(self, value: int) -> int:
+        """Add the next value of the sequence, return the new prediction."""
+        difference = value
+        for level, tail in enumerate(self.tails):
+            self.tails[level] = difference
+            difference -= tail
+
+        if self.max_depth is None or len(self.tails) < self.max_depth:
+            self.tails.append(difference)  # First value of a new row
+
+        self.count += 1
+        return self.prediction
+
+    @property
+    def prediction(self) -> int:
+        """The expected next value, 0 before any values came in."""
+        return sum(self.tails)
+
+
+class ExtrapolatorBank:
+    """Like `OnlineExtrapolator`, for many sequences stored in one int64 array.
+
+    Each difference row can double the size of the values, so values must stay
+    below `value_limit` (`2**(62 - max_depth)`) in size. Larger values raise an
+    `OverflowError`; use `OnlineExtrapolator` for those, it works with Python ints.
+    """
+
+    def __init__(self, sequences: int, max_depth: int):
+        if not 0 < max_depth < 62:
+            raise ValueError(f"Depth of {max_depth} does not fit in int64 rows")
+
+        self.value_limit = 1 << (62 - max_depth)
+        self.tails = np.zeros((sequences, max_depth), dtype=np.int64)
+        self.counts = np.zeros(sequences, dtype=np.int64)
+
+    def add(self, values: np.ndarray, sequences: Optional[np.ndarray] = None):
+        """Add the next value to each sequence, or only to the listed sequences.
+
+        Each sequence can be listed only once per call.
+        """
+        if sequences is None:
+            sequences = np.arange(len(self.counts))
+
+        tails = self.tails[sequences]
+        counts = self.counts[sequences]
+        difference = np.asarray(values, dtype=np.int64)
+        if np.any((difference >= self.value_limit) | (difference <= -self.value_limit)):
+            raise OverflowError(f"Values must be smaller than {self.value_limit}")
+
+        for level in range(tails.shape[1]):
+            tail = tails[:, level].copy()
+            # A row gets a value once the row above has a previous value:
+            tails[:, level] = np.where(counts >= level, difference, 0)
+            difference = difference - tail
+
+        self.tails[sequences] = tails
+        self.counts[sequences] = counts + 1
+
+    @property
+    def predictions(self) -> np.ndarray:
+        """The expected next value of each sequence."""
+        return self.tails.sum(axis=1)
+
+
+def parse(filename: str) -> List[List[int]]:
+    with open(filename, "r") as fh:
+        return [[int(txt) for txt in line.strip().split()] for line in fh.readlines()]
+
+
+def solve_by_differences(sequences: List[List[int]]) -> int:
     new_sum = 0
 
-    with open("input.txt", "r") as fh:
-        while (line := fh.readline()) != "":
-            sequence = [int(txt) for txt in line.strip().split()]
+    for sequence in sequences:
+        next_value = get_next_in_sequence(sequence)
+
+        new_sum += next_value
+
+    return new_sum
+
+
+def solve(sequences: List[List[int]]) -> int:
+    return sum(extrapolate(sequences)[0])
 
-            next_value = get_next_in_sequence(sequence)
 
-            new_sum += next_value
+def main(filename: str = "input.txt"):
+    new_sum = solve(parse(filename))
 
     print(f"Total sum of new values: {new_sum}")
 
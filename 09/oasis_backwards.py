@@ -1,5 +1,7 @@
 from typing import List
 
+from oasis import extrapolate
+
 
 def get_next_in_sequence(initial_sequence: List[int]) -> int:
     """Compute the next value in the sequence based on the diff rules."""
@@ -34,16 +36,28 @@ def get_next_in_sequence(initial_sequence: List[int]) -> int:
     return sequences_list[0][0]  # Last new value
 
 
-def main():
+def parse(filename: str) -> List[List[int]]:
+    with open(filename, "r") as fh:
+        return [[int(txt) for txt in line.strip().split()] for line in fh.readlines()]
+
+
+def solve_by_differences(sequences: List[List[int]]) -> int:
     new_sum = 0
 
-    with open("input.txt", "r") as fh:
-        while (line := fh.readline()) != "":
-            sequence = [int(txt) for txt in line.strip().split()]
+    for sequence in sequences:
+        next_value = get_next_in_sequence(sequence)
+
+        new_sum += next_value
+
+    return new_sum
+
+
+def solve(sequences: List[List[int]]) -> int:
+    return sum(extrapolate(sequences)[1])
 
-            next_value = get_next_in_sequence(sequence)
 
-            new_sum += next_value
+def main(filename: str = "input.txt"):
+    new_sum = solve(parse(filename))
 
     print(f"Total sum of new values: {new_sum}")
 
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+import numpy as np
+
+from oasis import ExtrapolatorBank, OnlineExtrapolator, extrapolate, parse
+
+
+def make_polynomial(rng: random.Random, degree: int, length: int):
+    coefficients = [rng.randint(-9, 9) for _ in range(degree + 1)]
+    return [sum(c * x**i for i, c in enumerate(coefficients)) for x in range(length)]
+
+
+class Day09TestCase(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(9)
+        self.sequences = [make_polynomial(rng, d % 5, 12) for d in range(40)]
+        self.sequences += [[rng.randint(-50, 50) for _ in range(8)] for _ in range(10)]
+
+    def test_online(self):
+        for sequence in self.sequences:
+            extrapolator = OnlineExtrapolator()
+            self.assertEqual(0, extrapolator.prediction)
+            for n, value in enumerate(sequence, start=1):
+                prediction = extrapolator.add(value)
+                self.assertEqual(extrapolate([sequence[:n]])[0][0], prediction)
+                self.assertEqual(n, extrapolator.count)
+
+    def test_online_max_depth(self):
+        # Rows below the degree of a polynomial are all zero, so cutting them off
+        # changes nothing
+        for sequence in self.sequences[:40]:
+            extrapolator = OnlineExtrapolator(max_depth=5)
+            for n, value in enumerate(sequence, start=1):
+                extrapolator.add(value)
+                self.assertEqual(
+                    extrapolate([sequence[:n]])[0][0], extrapolator.prediction
+                )
+            self.assertEqual(5, len(extrapolator.tails))
+
+    def test_bank(self):
+        rows = np.array(self.sequences[:40], dtype=np.int64)
+        bank = ExtrapolatorBank(len(rows), max_depth=5)
+        for n in range(1, rows.shape[1] + 1):
+            bank.add(rows[:, n - 1])
+            expected = extrapolate(rows[:, :n].tolist())[0]
+            self.assertEqual(expected, bank.predictions.tolist())
+
+    def test_bank_sequences(self):
+        rng = random.Random(23)
+        sequences = self.sequences[:40]
+        bank = ExtrapolatorBank(len(sequences), max_depth=5)
+        counts = [0] * len(sequences)
+
+        for _ in range(200):
+            subset = rng.sample(range(len(sequences)), rng.randint(1, 10))
+            subset = [i for i in subset if counts[i] < len(sequences[i])]
+            values = [sequences[i][counts[i]] for i in subset]
+            bank.add(np.array(values, dtype=np.int64), np.array(subset, dtype=np.intp))
+            for i in subset:
+                counts[i] += 1
+
+            expected = [
+                extrapolate([s[:n]])[0][0] if n else 0
+                for s, n in zip(sequences, counts)
+            ]
+            self.assertEqual(expected, bank.predictions.tolist())
+            self.assertEqual(counts, bank.counts.tolist())
+
+    def test_bank_overflow(self):
+        bank = ExtrapolatorBank(3, max_depth=10)
+        self.assertEqual(1 << 52, bank.value_limit)
+
+        bank.add(np.array([1, 2, 3]))
+        bank.add(np.array([bank.value_limit - 1, -bank.value_limit + 1, 0]))
+        tails = bank.tails.copy()
+        counts = bank.counts.copy()
+
+        for values in ([bank.value_limit, 0, 0], [0, -bank.value_limit, 0]):
+            with self.assertRaises(OverflowError):
+                bank.add(np.array(values))
+        with self.assertRaises(OverflowError):
+            bank.add(np.array([bank.value_limit]), np.array([2]))
+
+        np.testing.assert_array_equal(tails, bank.tails)
+        np.testing.assert_array_equal(counts, bank.counts)
+
+        with self.assertRaises(ValueError):
+            ExtrapolatorBank(3, max_depth=62)
+
+    def test_input(self):
+        sequences = parse("input.txt")
+        bank = ExtrapolatorBank(len(sequences), max_depth=len(sequences[0]))
+        for column in np.array(sequences, dtype=np.int64).T:
+            bank.add(column)
+        self.assertEqual(1980437560, int(bank.predictions.sum()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,15 @@
+import sys
+from array import array
+from pathlib import Path
 from typing import Optional, Set, Dict, Tuple, List
 from enum import Enum
 
+import numpy as np
+
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
+
+from aoc.loader import read_grid
 
 Coord = Tuple[int, int]  # (row, column)
 
@@ -22,12 +31,8 @@ class Tile:
     Coordinates are considered as (row, column), 0-indexed.
     """
 
-    # Tiles by coordinates
-    MAZE: Dict[Coord, "Tile"] = {}
-    ROWS: int = 0
-    COLS: int = 0
-
-    def __init__(self, row: int, col: int, shape: str):
+    def __init__(self, maze: "Maze", row: int, col: int, shape: str):
+        self.maze = maze
         self.row = row
         self.col = col
         self.shape = shape
@@ -53,16 +58,7 @@ class Tile:
         else:
             raise ValueError(f"Unrecognized shape `{shape}`")
 
-        self.add_to_maze(self)
-
-    @classmethod
-    def add_to_maze(cls, tile):
-        row, col = tile.coordinates
-        if row + 1 > cls.ROWS:
-            cls.ROWS = row + 1
-        if col + 1 > cls.COLS:
-            cls.COLS = col + 1
-        cls.MAZE[tile.coordinates] = tile
+        maze.add_tile(self)
 
     def __repr__(self) -> str:
         return f"<Tile ({self.row},{self.col}), '{self.shape}'>"
@@ -79,7 +75,7 @@ class Tile:
             coords = (coords[0], coords[1] - 1)
 
         try:
-            neighbour = self.MAZE[coords]
+            neighbour = self.maze.tiles[coords]
         except KeyError:
             return None
 
@@ -93,8 +89,34 @@ class Tile:
     def coordinates(self) -> Coord:
         return self.row, self.col
 
-    @classmethod
-    def get_loop(cls, tile: "Tile") -> List["Tile"]:
+    def __eq__(self, other):
+        return self.row == other.row and self.col == other.col
+
+
+class Maze:
+    """Container for all tiles of a single maze, by their coordinates."""
+
+    def __init__(self):
+        self.tiles: Dict[Coord, Tile] = {}  # Tiles by coordinates
+        self.rows: int = 0
+        self.cols: int = 0
+        self.start: Optional[Tile] = None
+
+    def __repr__(self) -> str:
+        return f"<Maze ({self.rows}x{self.cols})>"
+
+    def add_tile(self, tile: Tile):
+        row, col = tile.coordinates
+        if row + 1 > self.rows:
+            self.rows = row + 1
+        if col + 1 > self.cols:
+            self.cols = col + 1
+        self.tiles[tile.coordinates] = tile
+        if tile.shape == "S":
+            self.start = tile
+
+    @staticmethod
+    def get_loop(tile: Tile) -> List[Tile]:
         """Find the loop from a given tile.
 
         Splits (i.e. choices) cannot be present!
@@ -113,15 +135,15 @@ class Tile:
 
             while tile is not None:
                 chain.append(tile)
-                tile = Tile.get_next(chain)
+                tile = Maze.get_next(chain)
 
                 if tile == chain[0]:
                     return chain  # Completed the chain!
 
         raise RuntimeError("Failed to close chain")
 
-    @classmethod
-    def get_next(cls, chain: List["Tile"]) -> "Tile":
+    @staticmethod
+    def get_next(chain: List[Tile]) -> Tile:
         """Return next tile in a sequence."""
         for direction in chain[-1].ports:
             next_tile = chain[-1].get_neighbour(direction)
@@ -132,8 +154,7 @@ class Tile:
 
         raise RuntimeError(f"Could not find next in sequence")
 
-    @classmethod
-    def get_enclosed_count(cls, loop: List["Tile"]) -> int:
+    def get_enclosed_count(self, loop: List[Tile]) -> int:
         """Get number of tiles fully enclosed by given loop."""
         loop_by_coordinates: Dict[Coord, Tile] = {
             tile.coordinates: tile for tile in loop
@@ -141,17 +162,17 @@ class Tile:
 
         count = 0  # Number of surrounded tiles
 
-        row_start = cls.ROWS - 1
+        row_start = self.rows - 1
         col_start = 0
 
         # Walk over all diagonals, from the bottom left to top right:
-        while col_start < cls.COLS:
+        while col_start < self.cols:
             col = col_start
             row = row_start
 
             inside = False  # Always start outside area
 
-            while row < cls.ROWS and col < cls.COLS:
+            while row < self.rows and col < self.cols:
 
                 tile = loop_by_coordinates.get((row, col), None)
                 if tile is not None:
@@ -181,29 +202,189 @@ class Tile:
 
         return count
 
-    def __eq__(self, other):
-        return self.row == other.row and self.col == other.col
 
+# Grid engine, with directions as integers (in clockwise order) instead
+UP, RIGHT, DOWN, LEFT = range(4)
+BLOCKED = 4  # Outgoing direction for a tile that can't be entered
+
+PORTS: Dict[str, Tuple[int, ...]] = {
+    "|": (UP, DOWN),
+    "-": (LEFT, RIGHT),
+    "L": (UP, RIGHT),
+    "J": (LEFT, UP),
+    "7": (LEFT, DOWN),
+    "F": (RIGHT, DOWN),
+    ".": (),
+    "S": (UP, RIGHT, DOWN, LEFT),
+}
+
+
+def make_turn_table() -> np.ndarray:
+    """Get the outgoing direction by `(shape << 2) | incoming direction`.
+
+    The incoming direction is the direction of travel when entering the tile.
+    """
+    table = np.full(256 << 2, BLOCKED, dtype=np.uint8)
+    for shape, ports in PORTS.items():
+        if len(ports) != 2:
+            continue  # Walls, and the start is handled separately
+        for incoming in range(4):
+            side = (incoming + 2) % 4  # Side of the tile we come in from
+            if side in ports:
+                outgoing = ports[1] if side == ports[0] else ports[0]
+                table[(ord(shape) << 2) | incoming] = outgoing
+    return table
+
+
+TURNS = make_turn_table()
+
+
+class GridMaze:
+    """Maze stored as one byte per tile, walked with flat indices.
+
+    The characters are kept in a flat buffer, with a border of "." around them so
+    walking never needs bounds checks. Flat index `i` is at row `i // width - 1` and
+    column `i % width - 1` of the original maze.
+    """
+
+    def __init__(self, grid: np.ndarray):
+        rows, cols = grid.shape
+        padded = np.full((rows + 2, cols + 2), ord("."), dtype=np.uint8)
+        padded[1:-1, 1:-1] = grid
+
+        self.rows = rows
+        self.cols = cols
+        self.width = cols + 2
+        self.buffer = bytearray(padded)
+        self.tiles = np.frombuffer(self.buffer, dtype=np.uint8)  # Flat view
 
-def main():
-    starting_tile: Optional[Tile] = None
+        # Flat index change for each direction
+        self.steps = (-self.width, 1, self.width, -1)
 
-    with open("input.txt", "r") as fh:
+        starts = np.flatnonzero(self.tiles == ord("S"))
+        if len(starts) != 1:
+            raise ValueError(f"Expected a single start, found {len(starts)}")
+        self.start = int(starts[0])
+
+    def __repr__(self) -> str:
+        return f"<GridMaze ({self.rows}x{self.cols})>"
+
+    @staticmethod
+    def from_file(filename: str) -> "GridMaze":
+        return GridMaze(read_grid(filename))
+
+    def get_coordinates(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the (row, column) of flat indices."""
+        rows, cols = np.divmod(indices, self.width)
+        return rows - 1, cols - 1
+
+    def get_start_directions(self) -> List[int]:
+        """Get the directions out of the start that lead into a connecting tile."""
+        return [
+            d
+            for d, step in enumerate(self.steps)
+            if TURNS[(self.buffer[self.start + step] << 2) | d] != BLOCKED
+        ]
+
+    def get_loop(self) -> np.ndarray:
+        """Get the flat indices of the loop through the start, starting there."""
+        tiles = self.buffer
+        steps = self.steps
+        turns = TURNS.tolist()
+        start = self.start
+
+        for direction in self.get_start_directions():
+            loop = array("q", [start])  # 8 bytes per loop tile
+            append = loop.append
+            index = start + steps[direction]
+
+            while index != start:
+                direction = turns[(tiles[index] << 2) | direction]
+                if direction == BLOCKED:
+                    break  # Dead end, try another way out of the start
+                append(index)
+                index += steps[direction]
+            else:
+                return np.frombuffer(loop, dtype=np.int64)
+
+        raise RuntimeError("Failed to close the loop")
+
+    def get_enclosed_count(self, loop: np.ndarray) -> int:
+        """Get the number of tiles enclosed by the loop, from the loop alone.
+
+        The loop tiles are the vertices of a polygon, with the shoelace formula for
+        its area. Pick's theorem then gives the number of grid points inside:
+        `area = inside + border / 2 - 1`. See also day 18.
+        """
+        rows, cols = self.get_coordinates(loop)
+        next_rows, next_cols = np.roll(rows, -1), np.roll(cols, -1)
+        area = abs(int((rows * next_cols - next_rows * cols).sum())) / 2
+
+        return int(area - len(loop) / 2 + 1)
+
+    def get_enclosed_mask(self, loop: np.ndarray) -> np.ndarray:
+        """Get a (rows, cols) boolean array of the tiles enclosed by the loop.
+
+        Each row is scanned from the left: crossing a loop tile that connects
+        upwards flips between outside and inside. Corners that only connect
+        downwards are passed along the edge, without changing sides.
+        """
+        on_loop = np.zeros(len(self.tiles), dtype=bool)
+        on_loop[loop] = True
+
+        upwards = np.isin(self.tiles, np.frombuffer(b"|LJ", dtype=np.uint8))
+        if len(loop) > 1 and self.steps[UP] in (
+            loop[1] - self.start,
+            loop[-1] - self.start,
+        ):
+            upwards[self.start] = True  # The start connects up, as part of the loop
+        else:
+            upwards[self.start] = False
+
+        crossings = (on_loop & upwards).reshape(-1, self.width)
+        inside = np.bitwise_xor.accumulate(crossings, axis=1)
+        enclosed = inside & ~on_loop.reshape(-1, self.width)
+
+        return enclosed[1:-1, 1:-1]
+
+
+def parse_tiles(filename: str) -> Maze:
+    maze = Maze()
+
+    with open(filename, "r") as fh:
         row = 0
         while line := fh.readline():
             for col, shape in enumerate(line.strip()):
-                new_tile = Tile(row, col, shape)
-                if new_tile.shape == "S":
-                    starting_tile = new_tile
+                Tile(maze, row, col, shape)  # Registration is done inside constructor
             row += 1
 
-    loop = Tile.get_loop(starting_tile)
+    return maze
+
+
+def solve_tiles(maze: Maze) -> Tuple[int, int]:
+    loop = maze.get_loop(maze.start)
 
     max_steps = int(len(loop) / 2)
 
-    print(f"Biggest distance: {max_steps}")
+    size = maze.get_enclosed_count(loop)
+
+    return max_steps, size
+
 
-    size = Tile.get_enclosed_count(loop)
+def parse(filename: str) -> GridMaze:
+    return GridMaze.from_file(filename)
+
+
+def solve(maze: GridMaze) -> Tuple[int, int]:
+    loop = maze.get_loop()
+
+    return len(loop) // 2, maze.get_enclosed_count(loop)
+
+
+def main(filename: str = "input.txt"):
+    max_steps, size = solve(parse(filename))
+
+    print(f"Biggest distance: {max_steps}")
 
     print(f"Enclosed tiles: {size}")
 
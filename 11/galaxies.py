@@ -1,7 +1,16 @@
+import sys
 from dataclasses import dataclass
-from typing import List
+from pathlib import Path
+from typing import List, Tuple
 from copy import deepcopy
 
+import numpy as np
+
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
+
+from aoc.loader import read_grid
+
 
 @dataclass
 class Coord:
@@ -79,30 +88,33 @@ def sum_closest_distance(image: Image) -> int:
     return dist_sum
 
 
-def main():
+def parse(filename: str) -> Image:
+    grid = read_grid(filename)
 
-    with open("input.txt", "r") as fh:
+    rows, cols = np.nonzero(grid == ord("#"))  # Sorted by row, like reading order
+    galaxies = [
+        Coord(row=row, col=col) for row, col in zip(rows.tolist(), cols.tolist())
+    ]
 
-        image = Image(rows=0, cols=0, galaxies=[])
+    return Image(rows=grid.shape[0], cols=grid.shape[1], galaxies=galaxies)
 
-        # Load all data:
-        while line := fh.readline():
-            for col, char in enumerate(line):
-                if char == "#":
-                    coord = Coord(row=image.rows, col=col)
-                    image.galaxies.append(coord)
-
-            image.rows += 1
-    image.cols = col + 1
 
+def solve(image: Image) -> Tuple[int, int]:
     image_one = expand_empty_space(image, addition=1)
     dist_sum_one = sum_closest_distance(image_one)
-    print(f"Sum of shortest distances is: {dist_sum_one}")
 
     # Now again after ultra-expand:
 
     image_million = expand_empty_space(image, addition=1_000_000 - 1)
     dist_sum_million = sum_closest_distance(image_million)
+
+    return dist_sum_one, dist_sum_million
+
+
+def main(filename: str = "input.txt"):
+    dist_sum_one, dist_sum_million = solve(parse(filename))
+
+    print(f"Sum of shortest distances is: {dist_sum_one}")
     print(f"Sum of shortest distances is: {dist_sum_million}")
 
 
@@ -87,30 +87,39 @@ def get_number_of_arrangements_recursively(
     return arrangements
 
 
-def main():
+def parse(filename: str, part_2: bool = True) -> List[Tuple[StatesList, Tuple[int]]]:
+    """Get a list of `(states, numbers)` per line."""
+    records = []
 
-    total_arrangements = 0
-
-    part_2 = True
-
-    with open("input.txt", "r") as fh:
-        lines = 0
+    with open(filename, "r") as fh:
         while line := fh.readline():
             states_str, _, numbers_str = line.strip().partition(" ")
 
-            lines += 1
-            print(f"Line {lines}...")
-
             if part_2:
                 states_str = "?".join([states_str] * 5)
                 numbers_str = ",".join([numbers_str] * 5)
 
             states = State.get_from_str(states_str)
             numbers = [int(s) for s in numbers_str.split(",")]
-            arrangements = get_number_of_arrangements_recursively(
-                states, tuple(numbers)
-            )
-            total_arrangements += arrangements
+            records.append((states, tuple(numbers)))
+
+    return records
+
+
+def solve(records: List[Tuple[StatesList, Tuple[int]]]) -> int:
+    total_arrangements = 0
+
+    for lines, (states, numbers) in enumerate(records, start=1):
+        print(f"Line {lines}...")
+
+        arrangements = get_number_of_arrangements_recursively(states, numbers)
+        total_arrangements += arrangements
+
+    return total_arrangements
+
+
+def main(filename: str = "input.txt"):
+    total_arrangements = solve(parse(filename))
 
     print("Total:", total_arrangements)  # Works, but actually too slow
 
@@ -1,6 +1,13 @@
+import sys
 from enum import Enum
+from pathlib import Path
 from typing import List, Optional
 
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
+
+from aoc.loader import read_blocks
+
 
 class Tile(Enum):
     ROCK = "#"
@@ -68,27 +75,25 @@ def get_score(pattern: Pattern, **kwargs) -> int:
     raise ValueError("Found no symmetry at all!")
 
 
-def main():
+def parse(filename: str) -> List[Pattern]:
+    return [
+        [Tile.get_list_from_text(line.tobytes().decode()) for line in block]
+        for block in read_blocks(filename)
+    ]
+
 
+def solve(patterns: List[Pattern]) -> int:
     total_score = 0
 
-    with open("input.txt", "r") as fh:
+    for pattern in patterns:
+        score = get_score(pattern, expected_errors=1)
+        total_score += score
 
-        pattern: Pattern = []  # List of rows
+    return total_score
 
-        done = False
-        while not done:
-            line = fh.readline()
-            if not line:
-                done = True
-            line = line.strip()
-            if not line and pattern and pattern[0]:
-                score = get_score(pattern, expected_errors=1)
-                total_score += score
-                pattern = []
-                continue
 
-            pattern.append(Tile.get_list_from_text(line))
+def main(filename: str = "input.txt"):
+    total_score = solve(parse(filename))
 
     print("Score:", total_score)
 
@@ -1,7 +1,16 @@
+import sys
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 from typing import NamedTuple, Dict, Optional, List
 
+import numpy as np
+
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
+
+from aoc.loader import read_grid
+
 
 class Tile(Enum):
     ROUND = "O"  # Not actually a normal zero
@@ -143,27 +152,31 @@ def get_weight_after_many_cycles(platform: Platform, number: int) -> int:
     return score
 
 
-def main():
+def parse(filename: str) -> Platform:
     platform = Platform()
-    with open("input.txt", "r") as fh:
-        row = 0
-        while line := fh.readline():
-            line = line.strip()
-            for col, char in enumerate(line):
-                tile = Tile(char)
-                if tile == Tile.EMPTY:
-                    continue
-
-                platform.add_tile(row, col, tile)
-            row += 1
+    grid = read_grid(filename)
+
+    for row, col in zip(*np.nonzero(grid != ord(Tile.EMPTY.value))):
+        tile = Tile(chr(grid[row, col]))
+        platform.add_tile(int(row), int(col), tile)
+
+    return platform
 
-    platform.print()
 
+def solve(platform: Platform) -> int:
     # Part 1:
     # shift_up(platform)
 
     # Part 2:
-    score = get_weight_after_many_cycles(platform, 1000000000)
+    return get_weight_after_many_cycles(platform, 1000000000)
+
+
+def main(filename: str = "input.txt"):
+    platform = parse(filename)
+
+    platform.print()
+
+    score = solve(platform)
 
     print("Score:", score)
 
@@ -1,9 +1,7 @@
 import re
-from typing import List, NamedTuple
+from typing import List, NamedTuple, Tuple
 from collections import OrderedDict
 
-from tornado.options import options
-
 
 def hash_function(txt: str) -> int:
     """The HASH function."""
@@ -20,15 +18,15 @@ class Lens(NamedTuple):
     focal_length: int
 
 
-def main():
-    with open("input.txt", "r") as fh:
-        line = fh.readline().strip()
+def parse(filename: str) -> str:
+    with open(filename, "r") as fh:
+        return fh.readline().strip()
+
 
+def solve(line: str) -> Tuple[int, int]:
     # Part 1:
     parts = line.split(",")
-    value = sum(hash_function(part) for part in parts)
-
-    print("Sum:", value)
+    value_hash = sum(hash_function(part) for part in parts)
 
     # Part 2:
 
@@ -56,6 +54,14 @@ def main():
             new_val = (place + 1) * (box_idx + 1) * focal_length
             value += new_val
 
+    return value_hash, value
+
+
+def main(filename: str = "input.txt"):
+    value_hash, value = solve(parse(filename))
+
+    print("Sum:", value_hash)
+
     print("Sum:", value)
 
 
@@ -1,8 +1,14 @@
 import math
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 from typing import List, Tuple, Set, TypeVar
 from enum import Enum
 
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
+
+from aoc.loader import read_grid
 
 T = TypeVar("T")
 
@@ -141,15 +147,17 @@ def possible_starts(contraption: Contraption) -> Tuple[Direction, int, int]:
             yield start_dir, row, col
 
 
-def main():
-
+def parse(filename: str) -> Contraption:
     # Complete board:
     contraption = Contraption()
 
-    with open("input.txt", "r") as fh:
-        while line := fh.readline():
-            contraption.add_row(line)
+    for line in read_grid(filename):
+        contraption.add_row(line.tobytes().decode())
+
+    return contraption
 
+
+def solve(contraption: Contraption) -> Tuple[int, int]:
     contraption_orig = contraption.copy()
 
     # Part 1:
@@ -160,8 +168,6 @@ def main():
 
     value = contraption.get_lit_tiles()
 
-    print("Number:", value)
-
     # Part 2:
 
     max_value = None
@@ -169,9 +175,17 @@ def main():
     for start_dir, row, col in possible_starts(contraption):
         contraption_i: Contraption = contraption_orig.copy()
         contraption_i.propagate_light(row, col, start_dir)
-        value = contraption_i.get_lit_tiles()
-        if max_value is None or value > max_value:
-            max_value = value
+        value_i = contraption_i.get_lit_tiles()
+        if max_value is None or value_i > max_value:
+            max_value = value_i
+
+    return value, max_value
+
+
+def main(filename: str = "input.txt"):
+    value, max_value = solve(parse(filename))
+
+    print("Number:", value)
 
     print("Max:", max_value)
 
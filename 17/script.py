@@ -1,9 +1,16 @@
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 from typing import List, Optional, NamedTuple, Dict, DefaultDict
 from collections import defaultdict
 from enum import IntEnum
 from queue import PriorityQueue
 
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
+
+from aoc.loader import read_grid
+
 
 class Direction(IntEnum):
     NORTH = 1
@@ -181,15 +188,21 @@ class Map:
         print()
 
 
-def main():
-
+def parse(filename: str) -> Map:
     my_map = Map()
 
-    with open("input.txt", "r") as fh:
-        while line := fh.readline():
-            my_map.add_row(line.strip())
+    for line in read_grid(filename):
+        my_map.add_row(line.tobytes().decode())
+
+    return my_map
+
+
+def solve(my_map: Map) -> int:
+    return my_map.calculate_path()
+
 
-    value = my_map.calculate_path()
+def main(filename: str = "input.txt"):
+    value = solve(parse(filename))
 
     # Part one answer: 1008
     print("Lowest cost:", value)
@@ -120,18 +120,25 @@ class DigPlan:
         return interior_points + border_points
 
 
-def main():
-
+def parse(filename: str) -> DigPlan:
     plan = DigPlan()
 
-    with open("input.txt", "r") as fh:
+    with open(filename, "r") as fh:
         while line := fh.readline():
             # plan.add_instruction(line)
             plan.add_instruction_hex(line)
 
+    return plan
+
+
+def solve(plan: DigPlan) -> int:
     # plan.print()  # 52231 for part 1
 
-    surface = plan.get_surface()
+    return plan.get_surface()
+
+
+def main(filename: str = "input.txt"):
+    surface = solve(parse(filename))
     print("Surface:", surface)
 
 
@@ -1,7 +1,14 @@
+import sys
+from pathlib import Path
 from typing import Dict, Optional, List, Set, Tuple, Generator
 from dataclasses import dataclass
 from enum import Enum
 
+if (_root := str(Path(__file__).resolve().parents[1])) not in sys.path:
+    sys.path.append(_root)  # Make the shared `aoc` package importable
+
+from aoc.loader import read_blocks
+
 
 class Category(Enum):
     COOL = "x"
@@ -122,21 +129,16 @@ class Rule:
 class Workflow:
     """A single workflow instance."""
 
-    # Lookup of all made workflows
-    book: Dict[str, "Workflow"] = {}
-
     def __init__(self, name: str, rules: List[Rule]):
         self.name = name
         self.rules = rules
 
     @classmethod
-    def parse(cls, line: str):
-        """Register a new workflow."""
+    def from_string(cls, line: str) -> "Workflow":
         name, _, rules_str = line.strip().partition("{")
         rules_str = rules_str.rstrip("}")
         rules = [Rule.from_string(s) for s in rules_str.split(",")]
-        workflow = cls(name, rules)
-        cls.book[name] = workflow
+        return cls(name, rules)
 
     def get_next(self, part: Part) -> str:
         """Parse a part through the rules, finding the next workflow."""
@@ -146,19 +148,6 @@ class Workflow:
 
         raise ValueError("Not a single rule matched")
 
-    @classmethod
-    def process(cls, part: Part) -> bool:
-        """True for accepted, False otherwise."""
-        next_workflow_name = "in"
-        while next_workflow_name:
-            workflow = cls.book[next_workflow_name]
-            next_workflow_name = workflow.get_next(part)
-
-            if next_workflow_name == "A":
-                return True
-            elif next_workflow_name == "R":
-                return False
-
     def get_next_ranges(
         self, part_range: PartRange
     ) -> Generator[Tuple[str, PartRange], None, None]:
@@ -170,7 +159,48 @@ class Workflow:
             )
             yield rule.next_workflow_name, part_range_match
 
-    def process_range(self, part_range: PartRange) -> int:
+    def __repr__(self) -> str:
+        return f"<Workflow '{self.name}'>"
+
+
+class WorkflowBook:
+    """Lookup of all workflows of a single input, including "A" and "R"."""
+
+    def __init__(self):
+        self.workflows: Dict[str, Workflow] = {}
+
+        # Add accepted and rejected as workflows:
+        self.add(Workflow(name="A", rules=[]))
+        self.add(Workflow(name="R", rules=[]))
+
+    def __getitem__(self, name: str) -> Workflow:
+        return self.workflows[name]
+
+    def __repr__(self) -> str:
+        return f"<WorkflowBook of {len(self.workflows)} workflows>"
+
+    def add(self, workflow: Workflow):
+        self.workflows[workflow.name] = workflow
+
+    def parse(self, line: str) -> Workflow:
+        """Register a new workflow."""
+        workflow = Workflow.from_string(line)
+        self.add(workflow)
+        return workflow
+
+    def process(self, part: Part) -> bool:
+        """True for accepted, False otherwise."""
+        next_workflow_name = "in"
+        while next_workflow_name:
+            workflow = self.workflows[next_workflow_name]
+            next_workflow_name = workflow.get_next(part)
+
+            if next_workflow_name == "A":
+                return True
+            elif next_workflow_name == "R":
+                return False
+
+    def process_range(self, part_range: PartRange, name: str = "in") -> int:
         """Put a range of parts through the book and get the number of accepted values.
 
         We can check only the number of paths because none of the paths overlap, no need
@@ -178,47 +208,43 @@ class Workflow:
 
         Workflows are handled through recursion.
         """
-        if self.name == "A":
+        if name == "A":
             return part_range.count
-        if self.name == "R":
+        if name == "R":
             return 0
 
         final_part_range = 0
 
-        for next_name, next_range in self.get_next_ranges(part_range):
-            next_workflow = self.book[next_name]
-            new_part_range = next_workflow.process_range(next_range)
+        for next_name, next_range in self.workflows[name].get_next_ranges(part_range):
+            new_part_range = self.process_range(next_range, next_name)
             final_part_range += new_part_range
 
         return final_part_range
 
-    def __repr__(self) -> str:
-        return f"<Workflow '{self.name}'>"
 
+def parse(filename: str) -> Tuple[WorkflowBook, List[Part]]:
+    book = WorkflowBook()
+    parts: List[Part] = []
 
-def main():
-
-    # Add accepted and rejected as workflows:
-    Workflow.book["A"] = Workflow(name="A", rules=[])
-    Workflow.book["R"] = Workflow(name="R", rules=[])
+    workflow_lines, part_lines = read_blocks(filename)
 
-    parts: List[Part] = []
+    for line in workflow_lines:
+        book.parse(line.tobytes().decode())
 
-    with open("input.txt", "r") as fh:
-        while line := fh.readline():
-            # Workflows
-            if not line.strip():
-                break
+    for line in part_lines:
+        parts.append(Part.parse(line.tobytes().decode()))
 
-            Workflow.parse(line)
+    return book, parts
 
-        while line := fh.readline():
-            # Parts
-            part = Part.parse(line)
-            parts.append(part)
 
+def solve(book_and_parts: Tuple[WorkflowBook, List[Part]]) -> int:
+    book, _ = book_and_parts
     all_parts = PartRange.new_all()
-    final_count = Workflow.book["in"].process_range(all_parts)
+    return book.process_range(all_parts)
+
+
+def main(filename: str = "input.txt"):
+    final_count = solve(parse(filename))
 
     print(f"Count: {final_count:,} ({final_count})")
 
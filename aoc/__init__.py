@@ -0,0 +1,5 @@
+"""Shared tooling to run, time and benchmark the solvers of each day.
+
+Each day lives in its own directory (``01/`` to ``19/``) and every script in there
+exposes ``parse(filename)`` and ``solve(data)``, besides the usual ``main()``.
+"""
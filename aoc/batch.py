@@ -0,0 +1,101 @@
+"""Run a single solver over many input files, spread over a pool of processes.
+
+Usage (from the repository root):
+
+    python -m aoc.batch 08/wasteland "inputs/day08/*.txt" --workers 8
+    python -m aoc.batch 5 inputs/day05/
+
+Results are printed as JSON lines in the order in which they finish.
+"""
+
+import argparse
+import glob
+import json
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union
+
+from .runner import Solver, find, run
+
+
+def collect_inputs(pattern: Union[str, Path]) -> List[Path]:
+    """Get input files from a directory (all files in it) or from a glob pattern."""
+    path = Path(pattern)
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.is_file())
+
+    return sorted(Path(p) for p in glob.glob(str(pattern)) if Path(p).is_file())
+
+
+def run_file(solver: Solver, input_path: Path, memory: bool = False) -> Dict[str, Any]:
+    """Run a solver on a single file, reporting an error instead of raising.
+
+    The solver is loaded as a fresh module for every file, so no module-level state
+    (like the `@cache` of day 12) is carried over, also when a worker process is
+    reused.
+    """
+    try:
+        return run(solver, input_path, memory=memory)
+    except Exception as err:
+        return {
+            "solver": solver.key,
+            "input": str(input_path),
+            "error": repr(err),
+            "traceback": traceback.format_exc(),
+        }
+
+
+def run_batch(
+    solver: Solver,
+    inputs: Iterable[Path],
+    workers: Optional[int] = None,
+    memory: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Yield results of a solver over input files, as soon as each one finishes.
+
+    :param solver: Solver to run
+    :param inputs: Input files
+    :param workers: Number of processes, defaults to the number of CPUs
+    :param memory: Set True to also measure the peak memory
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run_file, solver, input_path, memory): input_path
+            for input_path in inputs
+        }
+
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as err:  # E.g. a worker process died
+                yield {
+                    "solver": solver.key,
+                    "input": str(futures[future]),
+                    "error": repr(err),
+                }
+
+
+def main(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.partition("\n")[0])
+    parser.add_argument("solver", help="Day or solver to run, e.g. `5` or `05/seeds`")
+    parser.add_argument("inputs", help="Directory or glob pattern of input files")
+    parser.add_argument(
+        "--workers", "-w", type=int, default=None, help="Number of processes"
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="Also measure the peak memory"
+    )
+    options = parser.parse_args(args)
+
+    inputs = collect_inputs(options.inputs)
+    if not inputs:
+        parser.error(f"No input files found for `{options.inputs}`")
+
+    for solver in find([options.solver]):
+        for result in run_batch(solver, inputs, options.workers, options.memory):
+            print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Benchmark all solvers on their own input and on synthetic, scaled-up inputs.
+
+Usage (from the repository root):
+
+    python -m aoc.benchmark                      # All days, scales 1, 10, 100, 1000
+    python -m aoc.benchmark 2 4 --scales 1 10 --output bench_output.txt
+
+A synthetic input of scale `n` is made by repeating the records of `input.txt` `n`
+times, in a way that still makes a valid puzzle for that day. Days for which that
+is not possible (e.g. a single network or a single loop) are only run at scale 1.
+"""
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any, Iterable
+
+from .runner import Solver, find, run
+
+Scaler = Callable[[str, int], str]
+
+
+def _lines(text: str) -> List[str]:
+    return [line for line in text.splitlines() if line.strip()]
+
+
+def repeat_lines(text: str, factor: int) -> str:
+    """Repeat all lines (e.g. independent records or grid rows)."""
+    return "\n".join(_lines(text) * factor) + "\n"
+
+
+def repeat_numbered_lines(text: str, factor: int) -> str:
+    """Repeat all lines, but keep the record numbers (`Game 12:`) increasing.
+
+    The numbers are right-aligned to the widest one, such that all lines keep the
+    same layout.
+    """
+    lines = _lines(text)
+    re_number = re.compile(r"^(\w+)\s+(\d+):")
+    count = factor * len(lines)
+    width = len(str(count))
+    new_lines = []
+    for i in range(count):
+        line = lines[i % len(lines)]
+        new_lines.append(re_number.sub(rf"\g<1> {i + 1:>{width}}:", line, count=1))
+    return "\n".join(new_lines) + "\n"
+
+
+def repeat_blocks(text: str, factor: int) -> str:
+    """Repeat all blocks that are separated by blank lines."""
+    blocks = [block.strip("\n") for block in text.split("\n\n") if block.strip()]
+    return "\n\n".join(blocks * factor) + "\n"
+
+
+def repeat_first_line_numbers(text: str, factor: int) -> str:
+    """Repeat the list of numbers on the first line (e.g. the seeds)."""
+    first, _, rest = text.partition("\n")
+    title, _, numbers = first.partition(":")
+    return f"{title}: {' '.join([numbers.strip()] * factor)}\n{rest}"
+
+
+def repeat_numbers_per_line(text: str, factor: int) -> str:
+    """Repeat the list of numbers of each `Title: 1 2 3` line."""
+    new_lines = []
+    for line in _lines(text):
+        title, _, numbers = line.partition(":")
+        new_lines.append(f"{title}: {' '.join([numbers.strip()] * factor)}")
+    return "\n".join(new_lines) + "\n"
+
+
+def repeat_comma_separated(text: str, factor: int) -> str:
+    """Repeat the steps of a single comma-separated line."""
+    return ",".join([text.strip()] * factor) + "\n"
+
+
+def repeat_second_block(text: str, factor: int) -> str:
+    """Keep the first block (e.g. the workflows) but repeat the lines after it."""
+    first, _, second = text.partition("\n\n")
+    return first + "\n\n" + repeat_lines(second, factor)
+
+
+# Way to scale up the input per day, `None` means it cannot be scaled:
+SCALERS: Dict[str, Optional[Scaler]] = {
+    "01": repeat_lines,
+    "02": repeat_numbered_lines,
+    "03": repeat_lines,
+    "04": repeat_numbered_lines,
+    "05": repeat_first_line_numbers,
+    "06": repeat_numbers_per_line,
+    "07": repeat_lines,
+    "08": None,  # Single network
+    "09": repeat_lines,
+    "10": None,  # Single loop
+    "11": repeat_lines,
+    "12": repeat_lines,
+    "13": repeat_blocks,
+    "14": repeat_lines,
+    "15": repeat_comma_separated,
+    "16": repeat_lines,
+    "17": repeat_lines,
+    "18": repeat_lines,
+    "19": repeat_second_block,
+}
+
+
+def benchmark(
+    solvers: List[Solver],
+    scales: Iterable[int] = (1, 10, 100, 1000),
+    memory: bool = True,
+) -> Iterable[Dict[str, Any]]:
+    """Yield a result for each solver and each scale.
+
+    Failing runs are reported with an `error` field instead of stopping the suite.
+    """
+    with tempfile.TemporaryDirectory(prefix="aoc_benchmark_") as tmp_dir:
+        for solver in solvers:
+            text = solver.default_input.read_text()
+            scaler = SCALERS.get(solver.day)
+
+            for scale in scales:
+                if scale == 1:
+                    input_path = solver.default_input
+                elif scaler is None:
+                    continue
+                else:
+                    input_path = Path(tmp_dir) / f"{solver.day}_x{scale}.txt"
+                    if not input_path.exists():
+                        input_path.write_text(scaler(text, scale))
+
+                try:
+                    result = run(solver, input_path, memory=memory)
+                except Exception as err:
+                    result = {
+                        "solver": solver.key,
+                        "input": str(input_path),
+                        "error": repr(err),
+                        "traceback": traceback.format_exc(),
+                    }
+
+                result["scale"] = scale
+                yield result
+
+
+def main(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.partition("\n")[0])
+    parser.add_argument(
+        "solvers", nargs="*", help="Days or solvers to run, e.g. `5` or `05/seeds`"
+    )
+    parser.add_argument(
+        "--scales",
+        "-s",
+        nargs="+",
+        type=int,
+        default=[1, 10, 100, 1000],
+        help="Input scale factors to run",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip measuring peak memory"
+    )
+    parser.add_argument("--output", "-o", help="Write JSON to a file instead")
+    options = parser.parse_args(args)
+
+    results = []
+    for result in benchmark(
+        find(options.solvers), options.scales, memory=not options.no_memory
+    ):
+        print(
+            f"{result['solver']} x{result['scale']}: "
+            + (
+                result["error"] if "error" in result else f"{result['solve_time']:.3f}s"
+            ),
+            file=sys.stderr,
+        )
+        results.append(result)
+
+    output = json.dumps(results, indent=2)
+    if options.output:
+        Path(options.output).write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
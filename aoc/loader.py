@@ -0,0 +1,147 @@
+"""Memory-mapped access to input files, without copying the bytes.
+
+Usage:
+
+    with InputFile("input.txt") as input_file:
+        for line in input_file.lines():  # `memoryview` per line
+            ...
+        grid = input_file.grid()  # 2D `uint8` array of characters
+
+Views and arrays that were handed out remain valid after the file is closed, the
+mapping is released once the last of them is gone.
+"""
+
+import mmap
+from pathlib import Path
+from typing import Iterator, List, Union
+
+import numpy as np
+
+
+class InputFile:
+    """Read-only, memory-mapped input file."""
+
+    def __init__(self, filename: Union[str, Path]):
+        self.filename = str(filename)
+
+        with open(self.filename, "rb") as fh:
+            try:
+                self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Cannot map an empty file
+                self._mmap = None
+
+        self.data = memoryview(self._mmap if self._mmap is not None else b"")
+
+    def __enter__(self) -> "InputFile":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"<InputFile '{self.filename}' ({len(self)} bytes)>"
+
+    def close(self):
+        """Release the mapping, unless views of it are still in use elsewhere."""
+        try:
+            self.data.release()
+            if self._mmap is not None:
+                self._mmap.close()
+        except BufferError:
+            pass  # Still exported, it's closed when the last view is gone
+
+    def array(self) -> np.ndarray:
+        """Get all bytes as a flat `uint8` array."""
+        return np.frombuffer(self.data, dtype=np.uint8)
+
+    def lines(self) -> Iterator[memoryview]:
+        """Yield each line, without the line ending."""
+        data = self._mmap if self._mmap is not None else b""
+        size = len(data)
+        start = 0
+        while start < size:
+            end = data.find(b"\n", start)
+            if end < 0:
+                end = size
+            stop = end - 1 if end > start and data[end - 1] == 13 else end  # "\r"
+            yield self.data[start:stop]
+            start = end + 1
+
+    def blocks(self) -> Iterator[List[memoryview]]:
+        """Yield lists of lines, for each block separated by blank lines."""
+        block: List[memoryview] = []
+        for line in self.lines():
+            if len(line) == 0 or (line[0] in b" \t" and not bytes(line).strip()):
+                if block:
+                    yield block
+                block = []
+                continue
+            block.append(line)
+
+        if block:
+            yield block
+
+    def grid(self) -> np.ndarray:
+        """Get the file as a 2D `uint8` array of characters, indexed as [row, col].
+
+        The array is a (read-only) view into the file, the line endings are skipped
+        over by the strides. All lines must be of equal length.
+        """
+        return grid_from_buffer(self.array())
+
+
+def grid_from_buffer(buffer: np.ndarray) -> np.ndarray:
+    """Get a 2D view of a flat `uint8` array of equal-length lines.
+
+    :param buffer: Characters, including the line endings (the last may be missing)
+    """
+    buffer = buffer[: len(buffer) - _count_trailing_whitespace(buffer)]
+    if len(buffer) == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    newlines = np.flatnonzero(buffer == ord("\n"))
+    if len(newlines) == 0:
+        return buffer.reshape(1, -1)
+
+    stride = int(newlines[0]) + 1  # Width including line ending
+    cols = stride - 1
+    if cols > 0 and buffer[cols - 1] == ord("\r"):
+        cols -= 1
+
+    rows = len(newlines) + 1
+    if len(buffer) != rows * stride - (stride - cols) or not np.array_equal(
+        newlines, np.arange(1, rows) * stride - 1
+    ):
+        raise ValueError("Lines are not all of the same length")
+
+    return np.lib.stride_tricks.as_strided(
+        buffer, shape=(rows, cols), strides=(stride, 1), writeable=False
+    )
+
+
+def _count_trailing_whitespace(buffer: np.ndarray) -> int:
+    count = 0
+    while count < len(buffer) and buffer[len(buffer) - 1 - count] in b"\r\n ":
+        count += 1
+    return count
+
+
+def read_lines(filename: Union[str, Path]) -> List[memoryview]:
+    """Get all lines of a file, see :meth:`InputFile.lines`."""
+    with InputFile(filename) as input_file:
+        return list(input_file.lines())
+
+
+def read_blocks(filename: Union[str, Path]) -> List[List[memoryview]]:
+    """Get all blocks of lines of a file, see :meth:`InputFile.blocks`."""
+    with InputFile(filename) as input_file:
+        return list(input_file.blocks())
+
+
+def read_grid(filename: Union[str, Path]) -> np.ndarray:
+    """Get the characters of a file as a 2D array, see :meth:`InputFile.grid`."""
+    with InputFile(filename) as input_file:
+        return input_file.grid()
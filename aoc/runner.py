@@ -0,0 +1,184 @@
+"""Run the solvers of any day on any input file, reporting timings as JSON.
+
+Usage (from the repository root):
+
+    python -m aoc.runner 05                      # All solvers of day 5
+    python -m aoc.runner 01/leet_parse --input other_input.txt
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import List, Dict, Any, Optional, Iterable, Union
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class Solver:
+    """Reference to a single solver script, e.g. `05/seeds_part2.py`."""
+
+    day: str
+    name: str
+    root: Path = ROOT
+
+    @property
+    def key(self) -> str:
+        return f"{self.day}/{self.name}"
+
+    @property
+    def path(self) -> Path:
+        return self.root / self.day / f"{self.name}.py"
+
+    @property
+    def default_input(self) -> Path:
+        return self.root / self.day / "input.txt"
+
+    def __str__(self):
+        return self.key
+
+
+def discover(root: Path = ROOT) -> List[Solver]:
+    """Find all solver scripts, sorted by day and name.
+
+    Tests (`test_*.py`) and benchmark scripts (`bench_*.py`) are skipped.
+    """
+    solvers = []
+    for day_dir in sorted(root.iterdir()):
+        if not day_dir.is_dir() or not day_dir.name.isdigit():
+            continue
+
+        for script in sorted(day_dir.glob("*.py")):
+            if script.name.startswith(("test_", "bench_")):
+                continue
+            solvers.append(Solver(day_dir.name, script.stem, root))
+
+    return solvers
+
+
+def find(queries: Iterable[str], root: Path = ROOT) -> List[Solver]:
+    """Select solvers by day (`"5"`, `"05"`) or by key (`"05/seeds"`).
+
+    An empty selection returns all solvers.
+    """
+    solvers = discover(root)
+    queries = list(queries)
+    if not queries:
+        return solvers
+
+    selected = []
+    for query in queries:
+        day, _, name = query.partition("/")
+        day = day.zfill(2)
+        matches = [s for s in solvers if s.day == day and name in ("", s.name)]
+        if not matches:
+            raise ValueError(f"No solver found for `{query}`")
+        selected += [s for s in matches if s not in selected]
+
+    return selected
+
+
+def load_module(solver: Solver) -> ModuleType:
+    """Import a solver script as a fresh module.
+
+    A new module object is made on every call, such that any class-level state of a
+    previous run is not carried over.
+    """
+    day_dir = str(solver.path.parent)
+    if day_dir not in sys.path:
+        sys.path.append(day_dir)  # Allow imports of sibling scripts
+
+    module_name = f"aoc_day_{solver.day}_{solver.name}"
+    spec = importlib.util.spec_from_file_location(module_name, solver.path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def to_json(value: Any) -> Any:
+    """Convert an answer into something JSON-serializable."""
+    if isinstance(value, (tuple, list)):
+        return [to_json(v) for v in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "item"):  # Numpy scalars
+        return value.item()
+    return str(value)
+
+
+def run(
+    solver: Solver,
+    input_path: Optional[Union[str, Path]] = None,
+    memory: bool = True,
+) -> Dict[str, Any]:
+    """Run a solver on an input file and measure it.
+
+    Anything the solver prints is discarded. The peak memory is measured in a second,
+    separate run, because `tracemalloc` slows down the solvers considerably.
+
+    :param solver: Solver to run
+    :param input_path: Input file, defaults to the `input.txt` of the day
+    :param memory: Set False to skip measuring the peak memory
+    :return: Dictionary of results
+    """
+    input_path = Path(input_path) if input_path else solver.default_input
+
+    module = load_module(solver)
+    with redirect_stdout(io.StringIO()):
+        time_start = time.perf_counter()
+        data = module.parse(str(input_path))
+        time_parsed = time.perf_counter()
+        answer = module.solve(data)
+        time_solved = time.perf_counter()
+
+    peak_memory = None
+    if memory:
+        del data
+        module = load_module(solver)
+        tracemalloc.start()
+        try:
+            with redirect_stdout(io.StringIO()):
+                module.solve(module.parse(str(input_path)))
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "solver": solver.key,
+        "input": str(input_path),
+        "parse_time": time_parsed - time_start,
+        "solve_time": time_solved - time_parsed,
+        "peak_memory": peak_memory,
+        "answer": to_json(answer),
+    }
+
+
+def main(args: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.partition("\n")[0])
+    parser.add_argument(
+        "solvers", nargs="*", help="Days or solvers to run, e.g. `5` or `05/seeds`"
+    )
+    parser.add_argument("--input", "-i", help="Input file, instead of `input.txt`")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip measuring peak memory"
+    )
+    options = parser.parse_args(args)
+
+    results = [
+        run(solver, options.input, memory=not options.no_memory)
+        for solver in find(options.solvers)
+    ]
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
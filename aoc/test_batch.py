@@ -0,0 +1,42 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from aoc.batch import collect_inputs, run_batch
+from aoc.runner import find, ROOT
+
+
+class BatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp_dir.name)
+
+        example = (ROOT / "08" / "input_example_ghosts.txt").read_text()
+        for i in range(4):
+            (self.dir / f"input_{i}.txt").write_text(example)
+        (self.dir / "input_broken.txt").write_text("LR\n\nnot a node\n")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_collect_inputs(self):
+        self.assertEqual(5, len(collect_inputs(self.dir)))
+        self.assertEqual(4, len(collect_inputs(self.dir / "input_[0-9].txt")))
+
+    def test_run_batch(self):
+        # A single worker re-uses its process, so no state may leak between files
+        (solver,) = find(["08/wasteland"])
+        results = list(run_batch(solver, collect_inputs(self.dir), workers=1))
+        self.assertEqual(5, len(results))
+
+        answers = [r["answer"] for r in results if "error" not in r]
+        self.assertEqual([6] * 4, answers)
+
+        errors = [r for r in results if "error" in r]
+        self.assertEqual(1, len(errors))
+        self.assertTrue(errors[0]["input"].endswith("input_broken.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from aoc.loader import InputFile, read_lines, read_blocks, read_grid, grid_from_buffer
+
+
+class LoaderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, content: bytes) -> Path:
+        path = self.dir / "input.txt"
+        path.write_bytes(content)
+        return path
+
+    def test_lines(self):
+        path = self.write(b"abc\r\n\nde\nf")
+        lines = [line.tobytes() for line in read_lines(path)]
+        self.assertEqual([b"abc", b"", b"de", b"f"], lines)
+
+    def test_empty(self):
+        path = self.write(b"")
+        self.assertEqual([], read_lines(path))
+        self.assertEqual((0, 0), read_grid(path).shape)
+
+    def test_blocks(self):
+        path = self.write(b"a\nb\n\n\nc\n\nd\n")
+        blocks = [[line.tobytes() for line in b] for b in read_blocks(path)]
+        self.assertEqual([[b"a", b"b"], [b"c"], [b"d"]], blocks)
+
+    def test_grid(self):
+        for content in (b"#..\n.#.\n..#\n", b"#..\n.#.\n..#", b"#..\r\n.#.\r\n..#\r\n"):
+            grid = read_grid(self.write(content))
+            self.assertEqual((3, 3), grid.shape)
+            self.assertEqual(np.uint8, grid.dtype)
+            np.testing.assert_array_equal(np.eye(3, dtype=bool), grid == ord("#"))
+
+    def test_grid_ragged(self):
+        buffer = np.frombuffer(b"#..\n.#\n..#\n", dtype=np.uint8)
+        with self.assertRaises(ValueError):
+            grid_from_buffer(buffer)
+
+    def test_views_outlive_file(self):
+        path = self.write(b"12\n34\n")
+        with InputFile(path) as input_file:
+            grid = input_file.grid()
+            line = next(input_file.lines())
+        self.assertEqual(ord("4"), grid[1, 1])
+        self.assertEqual(b"12", line.tobytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from aoc.runner import discover, find, run, ROOT
+from aoc.benchmark import repeat_numbered_lines, repeat_second_block
+
+
+class RunnerTestCase(unittest.TestCase):
+
+    def test_discover(self):
+        keys = [solver.key for solver in discover()]
+        self.assertIn("01/leet_parse", keys)
+        self.assertIn("19/script", keys)
+        self.assertNotIn("12/test_day_12", keys)
+
+    def test_find(self):
+        keys = [solver.key for solver in find(["4"])]
+        self.assertEqual(["04/scratchcards", "04/scratchcards_2"], keys)
+        keys = [solver.key for solver in find(["05/seeds"])]
+        self.assertEqual(["05/seeds"], keys)
+        with self.assertRaises(ValueError):
+            find(["05/nothing"])
+
+    def test_run(self):
+        (solver,) = find(["01/leet_parse_part_2"])
+        result = run(solver, ROOT / "01" / "input_sample.txt")
+        self.assertEqual(302, result["answer"])
+        self.assertGreater(result["peak_memory"], 0)
+        self.assertGreaterEqual(result["solve_time"], 0.0)
+
+    def test_run_twice(self):
+        # Class-level registries may not leak between runs
+        (solver,) = find(["08/wasteland"])
+        first = run(solver, ROOT / "08" / "input_example_ghosts.txt", memory=False)
+        second = run(solver, ROOT / "08" / "input_example_ghosts.txt", memory=False)
+        self.assertEqual(first["answer"], second["answer"])
+
+
+class ScalerTestCase(unittest.TestCase):
+
+    def test_repeat_numbered_lines(self):
+        text = "Game 1: 3 blue\nGame 2: 1 red\n"
+        new_text = repeat_numbered_lines(text, 2)
+        self.assertEqual(
+            "Game 1: 3 blue\nGame 2: 1 red\nGame 3: 3 blue\nGame 4: 1 red\n", new_text
+        )
+        new_text = repeat_numbered_lines(text, 5)
+        self.assertTrue(new_text.startswith("Game  1: 3 blue\n"))
+        self.assertTrue(new_text.endswith("Game 10: 1 red\n"))
+
+    def test_repeat_second_block(self):
+        text = "px{a<2006:qkq,rfg}\n\n{x=787}\n"
+        new_text = repeat_second_block(text, 2)
+        self.assertEqual("px{a<2006:qkq,rfg}\n\n{x=787}\n{x=787}\n", new_text)
+
+
+if __name__ == "__main__":
+    unittest.main()